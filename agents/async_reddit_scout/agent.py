@@ -1,3 +1,104 @@
-from dotenv import load_dotenv
-
-load_dotenv()
+import os
+from google.adk.agents import Agent
+from dotenv import load_dotenv
+
+from reddit_contractor_scount.agent import get_mock_reddit_contractor_news
+from .reddit_api import RedditAPIError, get_async_reddit_client
+
+# Load environment variables from the root .env file
+load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", "..", ".env"))
+
+# 'api' talks to Reddit; 'mock' serves canned titles so the agent runs offline
+REDDIT_BACKEND = os.getenv("REDDIT_BACKEND", "api").lower()
+
+
+class RedditCredentialsError(RedditAPIError):
+    """Raised when no Reddit API credentials are configured."""
+
+
+async def fetch_hot_titles(subreddit: str, limit: int = 10) -> list[str]:
+    """
+    Return up to ``limit`` hot post titles from a subreddit, skipping stickied posts.
+
+    Unlike the tool, failures are raised rather than returned as text. If the
+    listing fails after some pages arrived, those titles are returned.
+
+    Args:
+        subreddit: Subreddit name, with or without the ``r/`` prefix.
+        limit: The maximum number of post titles to return.
+
+    Raises:
+        RedditCredentialsError: If the Reddit API credentials are not set.
+        RedditAPIError: If the subreddit cannot be read.
+    """
+    subreddit = subreddit.strip().removeprefix("r/")
+    if REDDIT_BACKEND == "mock":
+        titles = get_mock_reddit_contractor_news(subreddit).get(subreddit)
+        if not isinstance(titles, list):
+            raise RedditAPIError(titles or f"No mock data for r/{subreddit}.")
+        return titles[:limit]
+
+    client = get_async_reddit_client()
+    if client is None:
+        raise RedditCredentialsError("Reddit API credentials are not set. Please check your environment variables.")
+
+    titles: list[str] = []
+    try:
+        async for page in client.iter_listing_pages(subreddit, "hot", limit=limit):
+            titles.extend(post["title"] for post in page if not post.get("stickied"))
+    except RedditAPIError as e:
+        print(f"--- Tool error: Reddit API error for r/{subreddit}: {e} ---")
+        if not titles:
+            raise
+        # Keep the pages that already arrived rather than discarding them
+    return titles
+
+
+async def fetch_reddit_hot_threads(subreddit: str, limit: int = 10) -> dict[str, list[str]]:
+    """
+    Fetches hot post titles from a subreddit without blocking the event loop.
+
+    Args:
+        subreddit: The name of the subreddit to fetch news from (e.g., 'hvac', 'contractors').
+        limit: The maximum number of post titles to return.
+
+    Returns:
+        A dictionary with the subreddit name as key and a list of
+        post titles as value. Returns a message if the subreddit cannot be read.
+    """
+    subreddit = subreddit.strip().removeprefix("r/")
+    print(f"--- Tool called: Async fetch from r/{subreddit} (backend={REDDIT_BACKEND}) ---")
+
+    try:
+        titles = await fetch_hot_titles(subreddit, limit)
+    except RedditCredentialsError as e:
+        return {subreddit: f"Error: {e}"}
+    except RedditAPIError as e:
+        if REDDIT_BACKEND == "mock":
+            return {subreddit: str(e)}
+        return {
+            subreddit: [
+                f"Error accessing r/{subreddit}. It might be private, banned, or non-existent. Details: {e}"
+            ]
+        }
+
+    if not titles:
+        return {subreddit: [f"No recent hot posts found in r/{subreddit}."]}
+    return {subreddit: titles}
+
+
+agent = Agent(
+    name="async_reddit_scout_agent",
+    description="A Reddit scout agent that fetches hot posts from a given subreddit using native async tools.",
+    model="gemini-1.5-flash-latest",
+    instruction=(
+        "You are the Async Reddit News Scout. Your task is to fetch hot post titles from any subreddit. "
+        "1. **Identify Subreddit:** Determine which subreddit the user wants news from. Default to 'hvac' if none is specified. "
+        "2. **Call Tool:** You **MUST** call the `fetch_reddit_hot_threads` tool with the identified subreddit name and optionally a limit. Call it once per subreddit. "
+        "3. **Present Results:** Present the returned titles as a concise, bulleted list and state which subreddit they came from. If the tool returns an error message, report it. "
+        "4. **Do Not Hallucinate:** Only provide information returned by the tool."
+    ),
+    tools=[fetch_reddit_hot_threads],
+)
+
+root_agent = agent
@@ -0,0 +1,244 @@
+"""
+Non-blocking Reddit API client for the async scout.
+Uses a shared httpx connection pool and app-only OAuth so tools never block the event loop.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+from opentelemetry import trace
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# Overridable so the client can be pointed at a local stand-in (see scripts/benchmarks)
+TOKEN_URL = os.getenv("REDDIT_AUTH_BASE_URL", "https://www.reddit.com").rstrip("/") + "/api/v1/access_token"
+API_BASE_URL = os.getenv("REDDIT_API_BASE_URL", "https://oauth.reddit.com").rstrip("/")
+
+MAX_RETRIES = 3
+MAX_BACKOFF_SECONDS = 60.0
+
+
+class RedditAPIError(Exception):
+    """Raised when Reddit returns an error that retrying will not fix."""
+
+
+class AsyncRedditClient:
+    """Async Reddit client sharing one HTTP connection pool and OAuth token.
+
+    A single instance is meant to serve every concurrent scout session in the
+    process. Rate-limit headers are tracked globally, so when the quota runs
+    out callers ``await`` the reset window instead of hammering the API.
+    """
+
+    def __init__(self, client_id: str, client_secret: str, user_agent: str, max_connections: int = 20):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.user_agent = user_agent
+        self.max_connections = max_connections
+        self._http: Optional[httpx.AsyncClient] = None
+        self._http_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock: Optional[asyncio.Lock] = None
+        self._ratelimit_reset_at = 0.0
+
+    async def _client(self) -> httpx.AsyncClient:
+        # Connection pools are bound to the loop that created them
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop or self._http.is_closed:
+            if self._http is not None:
+                await _close_http(self._http, self._http_loop)
+            self._http = httpx.AsyncClient(
+                headers={"User-Agent": self.user_agent},
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                timeout=httpx.Timeout(10.0),
+            )
+            self._http_loop = loop
+            self._token_lock = asyncio.Lock()
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        if self._http is not None:
+            http, self._http = self._http, None
+            await _close_http(http, self._http_loop)
+
+    async def _access_token(self, client: httpx.AsyncClient) -> str:
+        """
+        Return a valid app-only OAuth token, fetching a new one when needed.
+
+        Raises:
+            RedditAPIError: If Reddit refuses the credentials or answers with something unexpected.
+            httpx.TransportError: On network errors, so the caller can retry.
+        """
+        async with self._token_lock:
+            if self._token and time.monotonic() < self._token_expires_at:
+                return self._token
+            response = await client.post(
+                TOKEN_URL,
+                data={"grant_type": "client_credentials"},
+                auth=(self.client_id, self.client_secret),
+            )
+            if response.status_code != 200:
+                raise RedditAPIError(f"OAuth token request failed with HTTP {response.status_code}")
+            try:
+                payload = response.json()
+                token = payload["access_token"]
+                expires_in = float(payload.get("expires_in", 3600))
+            except (ValueError, KeyError, TypeError) as e:
+                raise RedditAPIError(f"Unexpected OAuth token response from Reddit: {e}") from e
+            self._token = token
+            # Refresh a minute early so in-flight requests never carry an expired token
+            self._token_expires_at = time.monotonic() + expires_in - 60
+            return self._token
+
+    async def _wait_for_ratelimit(self) -> None:
+        delay = self._ratelimit_reset_at - time.monotonic()
+        if delay > 0:
+            logger.info(f"Reddit rate limit exhausted, waiting {delay:.1f}s")
+            await asyncio.sleep(min(delay, MAX_BACKOFF_SECONDS))
+
+    def _record_ratelimit(self, headers: httpx.Headers) -> None:
+        try:
+            remaining = float(headers.get("x-ratelimit-remaining", "1"))
+            reset = float(headers.get("x-ratelimit-reset", "0"))
+        except ValueError:
+            return
+        if remaining < 1:
+            self._ratelimit_reset_at = max(self._ratelimit_reset_at, time.monotonic() + reset)
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        GET an OAuth API path, backing off on rate limits and server errors.
+
+        Raises:
+            RedditAPIError: On a non-retryable error or when retries run out.
+        """
+        client = await self._client()
+        for attempt in range(MAX_RETRIES + 1):
+            await self._wait_for_ratelimit()
+            try:
+                token = await self._access_token(client)
+                with tracer.start_as_current_span("reddit.api.get") as span:
+                    span.set_attribute("http.route", path)
+                    span.set_attribute("reddit.attempt", attempt)
+                    response = await client.get(
+                        f"{API_BASE_URL}{path}",
+                        params=params,
+                        headers={"Authorization": f"bearer {token}"},
+                    )
+                    span.set_attribute("http.status_code", response.status_code)
+            except httpx.TransportError as e:
+                if attempt == MAX_RETRIES:
+                    raise RedditAPIError(f"Network error talking to Reddit: {e}") from e
+                await asyncio.sleep(min(2 ** attempt, MAX_BACKOFF_SECONDS))
+                continue
+
+            self._record_ratelimit(response.headers)
+            if response.status_code == 200:
+                try:
+                    return response.json()
+                except ValueError as e:
+                    raise RedditAPIError(f"Reddit returned a non-JSON body for {path}") from e
+            if response.status_code == 401:
+                self._token = None  # Token revoked or expired early; fetch a new one
+            elif response.status_code == 429 or response.status_code >= 500:
+                retry_after = response.headers.get("retry-after")
+                delay = float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(min(delay, MAX_BACKOFF_SECONDS))
+            else:
+                raise RedditAPIError(f"Reddit returned HTTP {response.status_code} for {path}")
+        raise RedditAPIError(f"Reddit request for {path} failed after {MAX_RETRIES + 1} attempts")
+
+    async def iter_listing_pages(
+        self, subreddit: str, listing: str = "hot", limit: int = 10, page_size: int = 25
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of posts from a subreddit listing as each page arrives.
+
+        Args:
+            subreddit: Subreddit name without the 'r/' prefix.
+            listing: Listing to read ('hot', 'new', 'top', ...).
+            limit: Total number of posts to yield across all pages.
+            page_size: Posts requested per API call (Reddit caps this at 100).
+
+        Yields:
+            Lists of post data dicts, at most ``page_size`` long.
+        """
+        after = None
+        fetched = 0
+        while fetched < limit:
+            params = {"limit": min(page_size, limit - fetched, 100), "raw_json": 1}
+            if after:
+                params["after"] = after
+            payload = await self.get(f"/r/{subreddit}/{listing}", params=params)
+            data = payload.get("data", {})
+            posts = [child["data"] for child in data.get("children", [])]
+            if not posts:
+                return
+            posts = posts[: limit - fetched]
+            fetched += len(posts)
+            yield posts
+            after = data.get("after")
+            if not after:
+                return
+
+
+async def _close_http(http: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close an HTTP client on the loop that owns its connections, ignoring a loop that is gone."""
+    try:
+        if loop is not None and loop is not asyncio.get_running_loop() and loop.is_running():
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(http.aclose(), loop))
+        else:
+            await http.aclose()
+    except Exception as e:
+        logger.debug(f"Ignoring error while closing a stale Reddit HTTP client: {e}")
+
+
+def _close_in_background(client: AsyncRedditClient) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(client.aclose())
+        return
+    task = loop.create_task(client.aclose())
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+_shared_client: Optional[AsyncRedditClient] = None
+# Close tasks for replaced clients, referenced until they finish
+_closing: set = set()
+
+
+def get_async_reddit_client() -> Optional[AsyncRedditClient]:
+    """
+    Return the process-wide async client for the credentials in the environment.
+
+    Returns:
+        The client, or None if the Reddit API credentials are not set.
+    """
+    global _shared_client
+    client_id = os.getenv("REDDIT_CLIENT_ID")
+    client_secret = os.getenv("REDDIT_CLIENT_SECRET")
+    user_agent = os.getenv("REDDIT_USER_AGENT")
+    if not client_id or not client_secret or not user_agent:
+        return None
+    if _shared_client is None or (
+        _shared_client.client_id,
+        _shared_client.client_secret,
+        _shared_client.user_agent,
+    ) != (client_id, client_secret, user_agent):
+        if _shared_client is not None:
+            _close_in_background(_shared_client)
+        _shared_client = AsyncRedditClient(client_id, client_secret, user_agent)
+    return _shared_client
@@ -1,7 +1,52 @@
 import os
 from dotenv import load_dotenv
+from google.adk.agents import Agent
+from google.adk.models.lite_llm import LiteLlm
 
 # Sub-agent factories
+from async_reddit_scout.agent import fetch_reddit_hot_threads
+from summarizer.agent import create_summarizer_agent
+from .pipeline import get_digest_pipeline
 
 # Load environment variables (for GOOGLE_API_KEY)
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", "..", ".env"))
+
+
+async def create_reddit_digest(subreddits: list[str], speak: bool = True) -> dict:
+    """
+    Builds a complete news digest: fetches hot posts from every subreddit in parallel,
+    summarizes each one and converts each summary to speech.
+
+    Args:
+        subreddits: The subreddit names to include (e.g., ['hvac', 'plumbing']).
+        speak: Whether to produce audio for each summary.
+
+    Returns:
+        A dictionary with a 'subreddits' list holding each subreddit's titles,
+        summary, audio_url and stage timings (or an error message), and the
+        total elapsed seconds.
+    """
+    print(f"--- Tool called: Digest pipeline for {', '.join(subreddits)} (speak={speak}) ---")
+    return await get_digest_pipeline().run(subreddits, speak=speak)
+
+
+def create_coordinator_agent():
+    coordinator_llm = LiteLlm(model="gemini/gemini-1.5-pro-latest", api_key=os.environ.get("GOOGLE_API_KEY"))
+    coordinator = Agent(
+        name="coordinator_agent",
+        description="Coordinates finding Reddit posts, summarizing titles, and converting text to speech.",
+        model=coordinator_llm,
+        instruction=(
+            "You help users follow Reddit news for contractors and trades."
+            "\n1. When the user asks for a digest, briefing or audio news covering one or more subreddits, call `create_reddit_digest` once with all of them and report each summary and audio URL."
+            "\n2. When the user only asks for 'hot posts', call `fetch_reddit_hot_threads` for each subreddit and return the raw list."
+            "\n3. If the user then asks for a 'summary' of titles you already have, delegate them to the Summarizer and return its summary."
+            "\n4. For other queries, respond directly without tools or delegation."
+        ),
+        tools=[create_reddit_digest, fetch_reddit_hot_threads],
+        sub_agents=[create_summarizer_agent()],
+    )
+    return coordinator
+
+
+root_agent = create_coordinator_agent()
@@ -0,0 +1,190 @@
+"""
+Deterministic digest pipeline for the coordinator.
+Fetches subreddits concurrently, summarizes each one as soon as its titles arrive and
+sends each summary to the speaker A2A service, with no LLM turns spent on routing.
+
+Run a scheduled digest from the agents/ directory:
+    python -m coordinator.pipeline hvac plumbing contractors
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+from google.adk.runners import Runner
+from google.adk.sessions import InMemorySessionService
+from google.genai import types
+from opentelemetry import trace
+
+from async_reddit_scout.agent import fetch_hot_titles
+from async_reddit_scout.reddit_api import RedditAPIError
+from summarizer.agent import create_summarizer_agent
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# Stage calls (fetch, summarize, speak) running at once across every digest in the process
+PIPELINE_MAX_CONCURRENCY = int(os.getenv("PIPELINE_MAX_CONCURRENCY", "8"))
+PIPELINE_TITLE_LIMIT = int(os.getenv("PIPELINE_TITLE_LIMIT", "10"))
+SPEAKER_A2A_URL = os.getenv("SPEAKER_A2A_URL", "http://localhost:8003")
+SPEAKER_A2A_TIMEOUT = float(os.getenv("SPEAKER_A2A_TIMEOUT", "180"))
+
+# Retries when the speaker sheds load with 429/503
+SPEAKER_MAX_RETRIES = 2
+
+APP_NAME = "digest_pipeline"
+USER_ID = "digest_pipeline"
+
+
+class DigestPipeline:
+    """Runs scout -> summarizer -> speaker for many subreddits concurrently.
+
+    Each subreddit flows through its own chain, so its summary starts as soon
+    as its titles arrive and its TTS starts as soon as its summary is ready; a
+    digest takes roughly as long as its slowest chain. All chains from all
+    digests share ``max_concurrency`` stage slots.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = PIPELINE_MAX_CONCURRENCY,
+        speaker_url: str = SPEAKER_A2A_URL,
+        speaker_timeout: float = SPEAKER_A2A_TIMEOUT,
+    ):
+        self.speaker_url = speaker_url.rstrip("/")
+        self.speaker_timeout = speaker_timeout
+        self.session_service = InMemorySessionService()
+        self.runner = Runner(
+            agent=create_summarizer_agent(),
+            app_name=APP_NAME,
+            session_service=self.session_service,
+        )
+        self._slots = asyncio.Semaphore(max(1, max_concurrency))
+        self._http: Optional[httpx.AsyncClient] = None
+
+    async def run(self, subreddits: List[str], limit: int = PIPELINE_TITLE_LIMIT, speak: bool = True) -> Dict[str, Any]:
+        """
+        Build a digest for the given subreddits.
+
+        Args:
+            subreddits: Subreddit names; duplicates are fetched once.
+            limit: Maximum number of titles fetched per subreddit.
+            speak: Whether to synthesize each summary via the speaker service.
+
+        Returns:
+            A dict with one entry per subreddit (titles, summary, audio and
+            per-stage timings, or an error) and the total elapsed time.
+        """
+        unique = list(dict.fromkeys(s.strip().removeprefix("r/") for s in subreddits if s and s.strip()))
+        started = time.perf_counter()
+        with tracer.start_as_current_span("digest.run") as span:
+            span.set_attribute("digest.subreddits", len(unique))
+            results = await asyncio.gather(*(self._run_chain(name, limit, speak) for name in unique))
+        return {"subreddits": results, "elapsed": round(time.perf_counter() - started, 3)}
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    async def _run_chain(self, subreddit: str, limit: int, speak: bool) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"subreddit": subreddit, "timings": {}}
+        try:
+            titles = await self._stage(result, "fetch", self._fetch(subreddit, limit))
+            if isinstance(titles, str):
+                result["error"] = titles
+                return result
+            result["titles"] = titles
+
+            summary = await self._stage(result, "summarize", self._summarize(subreddit, titles))
+            result["summary"] = summary
+            if speak and summary:
+                result.update(await self._stage(result, "speak", self._speak(summary)))
+        except Exception as e:
+            # One failing subreddit should not sink the rest of the digest
+            logger.error(f"Digest chain for r/{subreddit} failed: {e}", exc_info=True)
+            result["error"] = str(e)
+        return result
+
+    async def _stage(self, result: Dict[str, Any], stage: str, work) -> Any:
+        """Run one stage under a shared slot, recording its span and duration."""
+        async with self._slots:
+            started = time.perf_counter()
+            with tracer.start_as_current_span(f"digest.{stage}") as span:
+                span.set_attribute("reddit.subreddit", result["subreddit"])
+                try:
+                    return await work
+                finally:
+                    result["timings"][stage] = round(time.perf_counter() - started, 3)
+
+    async def _fetch(self, subreddit: str, limit: int):
+        """Return the subreddit's titles, or an error message if there are none to summarize."""
+        try:
+            titles = await fetch_hot_titles(subreddit, limit)
+        except RedditAPIError as e:
+            return f"Error accessing r/{subreddit}: {e}"
+        return titles or f"No recent hot posts found in r/{subreddit}."
+
+    async def _summarize(self, subreddit: str, titles: List[str]) -> str:
+        session = await self.session_service.create_session(app_name=APP_NAME, user_id=USER_ID)
+        headlines = "\n".join(f"- {title}" for title in titles)
+        message = types.Content(role="user", parts=[types.Part(text=f"Subreddit: {subreddit}\n{headlines}")])
+        summary = ""
+        try:
+            async for event in self.runner.run_async(user_id=USER_ID, session_id=session.id, new_message=message):
+                if event.is_final_response() and event.content and event.content.parts:
+                    summary = "".join(part.text or "" for part in event.content.parts)
+        finally:
+            # Every summary is a one-shot conversation; don't let sessions pile up
+            await self.session_service.delete_session(app_name=APP_NAME, user_id=USER_ID, session_id=session.id)
+        return summary.strip()
+
+    async def _speak(self, text: str) -> Dict[str, Any]:
+        if self._http is None:
+            self._http = httpx.AsyncClient(base_url=self.speaker_url, timeout=self.speaker_timeout)
+        # Summaries are long; chunked mode synthesizes their sentences concurrently
+        payload = {"message": text, "context": {"echo_events": False, "chunked": True}}
+        for attempt in range(SPEAKER_MAX_RETRIES + 1):
+            response = await self._http.post("/run", json=payload)
+            if response.status_code in (429, 503) and attempt < SPEAKER_MAX_RETRIES:
+                retry_after = response.headers.get("retry-after")
+                await asyncio.sleep(float(retry_after) if retry_after and retry_after.isdigit() else 2 ** attempt)
+                continue
+            response.raise_for_status()
+            break
+        data = response.json().get("data", {})
+        return {"audio_url": data.get("audio_url"), "audio_path": data.get("audio_path")}
+
+
+_pipeline: Optional[DigestPipeline] = None
+
+
+def get_digest_pipeline() -> DigestPipeline:
+    """Return the process-wide pipeline, so all digests share one set of stage slots."""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = DigestPipeline()
+    return _pipeline
+
+
+async def _main(subreddits: List[str], limit: int, speak: bool) -> None:
+    pipeline = get_digest_pipeline()
+    try:
+        print(json.dumps(await pipeline.run(subreddits, limit=limit, speak=speak), indent=2))
+    finally:
+        await pipeline.aclose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Build a Reddit audio digest without LLM routing")
+    parser.add_argument("subreddits", nargs="+", help="Subreddits to include")
+    parser.add_argument("--limit", type=int, default=PIPELINE_TITLE_LIMIT, help="Titles per subreddit")
+    parser.add_argument("--no-speak", action="store_true", help="Skip text-to-speech")
+    args = parser.parse_args()
+    asyncio.run(_main(args.subreddits, args.limit, not args.no_speak))
@@ -1,13 +1,34 @@
 import os
 import random
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from google.adk.agents import Agent
 from dotenv import load_dotenv
-import praw
-from praw.exceptions import PRAWException
+from opentelemetry import trace
+
+from .cache import TTLCache
+from .reddit_client import SUBREDDIT_ERRORS, get_client_pool
+from .watcher import get_subreddit_watcher
 
 # Load environment variables from the root .env file
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", "..", ".env"))
 
+tracer = trace.get_tracer(__name__)
+
+# Shared result cache keyed by (subreddit, listing, limit)
+reddit_cache = TTLCache(
+    maxsize=int(os.getenv("REDDIT_CACHE_MAXSIZE", "256")),
+    ttl=float(os.getenv("REDDIT_CACHE_TTL", "300")),
+    stale_ttl=float(os.getenv("REDDIT_CACHE_STALE_TTL", "900")),
+)
+
+# Bounded pool used to fan out multi-subreddit fetches
+REDDIT_FETCH_TIMEOUT = float(os.getenv("REDDIT_FETCH_TIMEOUT", "10"))
+_fetch_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv("REDDIT_FETCH_WORKERS", "8")),
+    thread_name_prefix="reddit-fetch",
+)
+
 
 def get_mock_reddit_contractor_news(subreddit: str) -> dict[str, list[str]]:
     """
@@ -120,30 +141,22 @@ def get_reddit_contractor_news(subreddit: str) -> dict[str, list[str]]:
     client_secret = os.getenv("REDDIT_CLIENT_SECRET")
     user_agent = os.getenv("REDDIT_USER_AGENT")
 
-    print(
-        f"Reddit API credentials: client_id={client_id}, client_secret={client_secret}, user_agent={user_agent}"
-    )
-
     if not client_id or not client_secret or not user_agent:
         return {
             subreddit: "Error: Reddit API credentials are not set. Please check your environment variables."
         }
 
+    cache_key = (subreddit.lower(), "hot", 5)
     try:
-        reddit = praw.Reddit(
-            client_id=client_id,
-            client_secret=client_secret,
-            user_agent=user_agent,
-        )
-
-        reddit.subreddits.search_by_name(subreddit, exact=True)
-        sub = reddit.subreddit(subreddit)
-        top_posts = list(sub.hot(limit=5))  # Fetch hot posts
-        titles = [post.title for post in top_posts]
+        with tracer.start_as_current_span("reddit.get_hot_titles") as span:
+            span.set_attribute("reddit.subreddit", subreddit)
+            titles = reddit_cache.get_or_fetch(
+                cache_key, lambda: _fetch_hot_titles(subreddit, limit=5)
+            )
         if not titles:
             return {subreddit: [f"No recent hot posts found in r/{subreddit}."]}
         return {subreddit: titles}
-    except PRAWException as e:
+    except SUBREDDIT_ERRORS as e:
         print(f"--- Tool error: Reddit API error for r/{subreddit}: {e} ---")
         # More specific error handling could be added here (e.g., 404 for invalid sub)
         return {
@@ -156,6 +169,119 @@ def get_reddit_contractor_news(subreddit: str) -> dict[str, list[str]]:
         return {subreddit: f"Error: Unable to connect to Reddit API. {str(e)}"}
 
 
+def _fetch_hot_titles(subreddit: str, limit: int) -> list[str]:
+    """Fetch hot post titles using a pooled, already-authenticated client."""
+    pool = get_client_pool()
+    if pool is None:
+        raise RuntimeError("Reddit API credentials are not set.")
+    # Only cache misses and background refreshes get here, so this span is the real API cost
+    with tracer.start_as_current_span("reddit.fetch") as span, pool.client(timeout=30) as reddit:
+        span.set_attribute("reddit.subreddit", subreddit)
+        reddit.subreddits.search_by_name(subreddit, exact=True)
+        sub = reddit.subreddit(subreddit)
+        return [post.title for post in sub.hot(limit=limit)]  # Fetch hot posts
+
+
+def get_reddit_contractor_news_batch(subreddits: list[str]) -> dict[str, list[str]]:
+    """
+    Fetches the top post titles from several subreddits at once.
+
+    Args:
+        subreddits: The subreddit names to fetch news from (e.g., ['hvac', 'contractors', 'plumbing']).
+
+    Returns:
+        A single dictionary with each subreddit name as key and a list of
+        post titles as value. Subreddits that fail or time out map to an
+        error message; the others are still returned.
+    """
+    # Preserve order but drop duplicates (case-insensitively) so each subreddit is fetched once
+    unique = list(dict.fromkeys(s.strip().lower().removeprefix("r/") for s in subreddits if s and s.strip()))
+    print(f"--- Tool called: Fetching from {len(unique)} subreddits: {', '.join(unique)} ---")
+    if not unique:
+        return {}
+
+    submitted = time.monotonic()
+    started: dict = {}
+
+    def fetch(name: str) -> dict:
+        started[name] = time.monotonic()
+        return get_reddit_contractor_news(name)
+
+    def deadline(name: str) -> float:
+        # Each subreddit gets REDDIT_FETCH_TIMEOUT from when its fetch starts
+        # (or from submission while it is still queued)
+        return started.get(name, submitted) + REDDIT_FETCH_TIMEOUT
+
+    pending = {name: _fetch_executor.submit(fetch, name) for name in unique}
+    results: dict = {}
+    while pending:
+        now = time.monotonic()
+        for name, future in list(pending.items()):
+            if future.done():
+                del pending[name]
+                try:
+                    results.update(future.result())
+                except Exception as e:
+                    results[name] = f"Error: Unable to fetch r/{name}. {str(e)}"
+            elif now >= deadline(name):
+                # Queued fetches are dropped; running ones end at the client's request timeout
+                future.cancel()
+                del pending[name]
+                results[name] = f"Error: Timed out after {REDDIT_FETCH_TIMEOUT:g}s fetching r/{name}."
+        if pending:
+            wait(pending.values(), timeout=max(0.0, min(map(deadline, pending)) - time.monotonic()), return_when=FIRST_COMPLETED)
+    return {name: results[name] for name in unique}
+
+
+def get_new_reddit_contractor_posts(subreddits: list[str]) -> dict[str, list[str]]:
+    """
+    Fetches only the posts made in the given subreddits since their last digest.
+
+    Each post is returned once; a subreddit requested for the first time
+    returns its most recent posts. Use this for recurring digests so old
+    posts are not summarized again.
+
+    Args:
+        subreddits: The subreddit names to check (e.g., ['hvac', 'contractors']).
+
+    Returns:
+        A dictionary with each subreddit name as key and a list of new
+        post titles (oldest first) as value, or an error message.
+    """
+    unique = list(dict.fromkeys(s.strip().lower().removeprefix("r/") for s in subreddits if s and s.strip()))
+    print(f"--- Tool called: New posts since last digest from {', '.join(unique)} ---")
+    if not unique:
+        return {}
+    if get_client_pool() is None:
+        return {name: "Error: Reddit API credentials are not set. Please check your environment variables." for name in unique}
+
+    try:
+        with tracer.start_as_current_span("reddit.get_new_posts") as span:
+            span.set_attribute("reddit.subreddits", len(unique))
+            new_posts, errors = get_subreddit_watcher().take_new(unique)
+    except Exception as e:
+        return {name: f"Error: Unable to connect to Reddit API. {str(e)}" for name in unique}
+
+    results = {}
+    for name in unique:
+        if name in errors:
+            print(f"--- Tool error: Reddit API error for r/{name}: {errors[name]} ---")
+            results[name] = [f"Error accessing r/{name}. It might be private, banned, or non-existent. Details: {errors[name]}"]
+        else:
+            results[name] = new_posts[name] or [f"No new posts in r/{name} since the last digest."]
+    return results
+
+
+def get_reddit_watch_stats() -> dict:
+    """Return poll counters and seen-index size for the subreddit watcher."""
+    return get_subreddit_watcher().stats()
+
+
+def get_reddit_cache_stats() -> dict:
+    """Return hit/miss counters for the shared Reddit result cache."""
+    return reddit_cache.stats()
+
+
 agent = Agent(
     name="reddit_scout_agent",
     description="A Reddit Agent taht searches for the most relevant posts in a given subreddit.",
@@ -167,8 +293,10 @@ agent = Agent(
         "3. **Summarize Output:** Take the top 5-10 hot posts with their titles returned from the bot."
         "4. **Format Response:** Present the information as a concise, bulleted list. Clearly state which subreddit(s) the information came from. If the tool indicates an error or an unknown subreddit, report that error message."
         "5. **MUST CALL TOOL:** You **MUST** call the `get_mock_reddit_contractor_news` tool with the identified subreddit(s). Do NOT generate summaries without calling the tool first."
+        "6. **Batch Subreddits:** When more than one subreddit is needed, call `get_reddit_contractor_news_batch` ONCE with the full list instead of calling a tool per subreddit."
+        "7. **Only New Posts:** When asked for what is new, or for a recurring/daily digest, call `get_new_reddit_contractor_posts` ONCE with the full list; it returns only posts not covered by an earlier digest."
     ),
-    tools=[get_reddit_contractor_news],
+    tools=[get_reddit_contractor_news, get_reddit_contractor_news_batch, get_new_reddit_contractor_posts],
 )
 
 root_agent = agent
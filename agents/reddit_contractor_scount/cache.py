@@ -0,0 +1,172 @@
+"""
+TTL/LRU result cache for the Reddit scout tools.
+Serves repeated subreddit lookups from memory and refreshes stale entries in the background.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-entry TTL and stale-while-revalidate refresh.
+
+    An entry is *fresh* for ``ttl`` seconds after it was stored. For a further
+    ``stale_ttl`` seconds it is *stale*: it is still returned immediately, but a
+    single background refresh is started so the next caller sees new data.
+    After that the entry is expired and the next lookup fetches synchronously.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: float = 300.0, stale_ttl: float = 600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # key -> [lock, number of callers holding or waiting for it]
+        self._key_locks: Dict[Hashable, list] = {}
+        self._refreshing: set = set()
+        self._stats = {
+            "hits": 0,
+            "stale_hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_errors": 0,
+            "evictions": 0,
+        }
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Any],
+        should_cache: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """
+        Return the cached value for ``key``, calling ``fetch`` on a miss.
+
+        Concurrent misses for the same key share a single ``fetch`` call.
+
+        Args:
+            key: Hashable cache key.
+            fetch: Zero-argument callable producing the value.
+            should_cache: Optional predicate; values for which it returns False
+                (e.g. error results) are returned but not stored.
+
+        Returns:
+            The cached or freshly fetched value.
+        """
+        value, state = self._lookup(key)
+        if state == "fresh":
+            return value
+        if state == "stale":
+            self._refresh_in_background(key, fetch, should_cache)
+            return value
+
+        # Miss: serialize fetches per key so a burst of callers makes one request.
+        with self._locked(key):
+            value, state = self._lookup(key, count=False)
+            if state is not None:
+                return value
+            value = fetch()
+            if should_cache is None or should_cache(value):
+                self.set(key, value)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or the whole cache when ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the current size."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_ratio"] = round((stats["hits"] + stats["stale_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def _lookup(self, key: Hashable, count: bool = True) -> tuple[Any, Optional[str]]:
+        """Return ``(value, state)`` where state is 'fresh', 'stale' or None."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                age = now - stored_at
+                if age < self.ttl:
+                    self._entries.move_to_end(key)
+                    if count:
+                        self._stats["hits"] += 1
+                    return value, "fresh"
+                if age < self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    if count:
+                        self._stats["stale_hits"] += 1
+                    return value, "stale"
+                del self._entries[key]
+            if count:
+                self._stats["misses"] += 1
+            return None, None
+
+    @contextmanager
+    def _locked(self, key: Hashable):
+        """Hold the per-key fetch lock; it is dropped once no caller needs it."""
+        with self._lock:
+            entry = self._key_locks.get(key)
+            if entry is None:
+                entry = self._key_locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._key_locks[key]
+
+    def _refresh_in_background(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Any],
+        should_cache: Optional[Callable[[Any], bool]],
+    ) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                value = fetch()
+                if should_cache is None or should_cache(value):
+                    self.set(key, value)
+                with self._lock:
+                    self._stats["refreshes"] += 1
+            except Exception as e:
+                logger.warning(f"Background refresh failed for {key!r}: {e}")
+                with self._lock:
+                    self._stats["refresh_errors"] += 1
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name=f"cache-refresh-{key}", daemon=True).start()
@@ -0,0 +1,127 @@
+"""
+Process-wide pool of authenticated PRAW clients.
+Reuses OAuth sessions across tool calls instead of building a new client per call.
+"""
+
+import logging
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+import praw
+from praw.exceptions import PRAWException
+from prawcore.exceptions import Forbidden, NotFound, Redirect, UnavailableForLegalReasons
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = int(os.getenv("REDDIT_POOL_SIZE", "4"))
+# Seconds each HTTP request to Reddit may take, so an abandoned fetch cannot hold a worker for long
+REQUEST_TIMEOUT = int(float(os.getenv("REDDIT_REQUEST_TIMEOUT", "10")))
+
+# Overridable so PRAW can be pointed at a local stand-in (see scripts/benchmarks);
+# PRAW only reads these from praw.ini or constructor kwargs, not praw_* env vars
+URL_OVERRIDES = {
+    key: value.rstrip("/")
+    for key, value in (
+        ("oauth_url", os.getenv("REDDIT_API_BASE_URL")),
+        ("reddit_url", os.getenv("REDDIT_AUTH_BASE_URL")),
+    )
+    if value
+}
+
+# Errors that mean one subreddit cannot be read (non-existent, banned, private),
+# as opposed to Reddit being unreachable. prawcore's are not PRAWExceptions.
+SUBREDDIT_ERRORS = (PRAWException, Forbidden, NotFound, Redirect, UnavailableForLegalReasons)
+
+
+class RedditClientPool:
+    """A bounded pool of ``praw.Reddit`` clients sharing one set of credentials.
+
+    PRAW clients are not safe to share between threads, so each caller checks a
+    client out for the duration of its request. Clients are created lazily up to
+    ``max_size`` and kept for the life of the process, so the OAuth token and the
+    underlying HTTP session are negotiated once per client rather than per call.
+    """
+
+    def __init__(self, client_id: str, client_secret: str, user_agent: str, max_size: int = DEFAULT_POOL_SIZE):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.user_agent = user_agent
+        self.max_size = max(1, max_size)
+        self._idle: "queue.LifoQueue[praw.Reddit]" = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def client(self, timeout: Optional[float] = None) -> Iterator[praw.Reddit]:
+        """
+        Check out a client for the duration of the ``with`` block.
+
+        Args:
+            timeout: Seconds to wait for a client when the pool is exhausted.
+
+        Raises:
+            TimeoutError: If no client became available within ``timeout``.
+        """
+        reddit = self._acquire(timeout)
+        try:
+            yield reddit
+        finally:
+            self._idle.put(reddit)
+
+    def _acquire(self, timeout: Optional[float]) -> praw.Reddit:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self.max_size
+            if can_create:
+                self._created += 1
+        if can_create:
+            logger.info(f"Creating Reddit client {self._created}/{self.max_size}")
+            try:
+                return praw.Reddit(
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                    user_agent=self.user_agent,
+                    timeout=REQUEST_TIMEOUT,
+                    **URL_OVERRIDES,
+                )
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No Reddit client available after {timeout}s (pool size {self.max_size})")
+
+
+_pools: Dict[Tuple[str, str, str], RedditClientPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_client_pool() -> Optional[RedditClientPool]:
+    """
+    Return the shared pool for the credentials in the environment.
+
+    Returns:
+        The pool, or None if the Reddit API credentials are not set.
+    """
+    client_id = os.getenv("REDDIT_CLIENT_ID")
+    client_secret = os.getenv("REDDIT_CLIENT_SECRET")
+    user_agent = os.getenv("REDDIT_USER_AGENT")
+    if not client_id or not client_secret or not user_agent:
+        return None
+
+    key = (client_id, client_secret, user_agent)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = RedditClientPool(client_id, client_secret, user_agent)
+        return pool
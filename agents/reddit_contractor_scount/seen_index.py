@@ -0,0 +1,149 @@
+"""
+SQLite-backed index of Reddit posts the scout has already seen.
+Records which posts are still waiting for a digest and the listing cursors
+used to fetch only newer posts.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (subreddit, post_id, title, created_utc)
+PostRecord = Tuple[str, str, str, float]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    subreddit TEXT NOT NULL,
+    post_id TEXT NOT NULL,
+    title TEXT NOT NULL,
+    created_utc REAL NOT NULL,
+    pending INTEGER NOT NULL,
+    PRIMARY KEY (subreddit, post_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS posts_by_age ON posts (subreddit, pending, created_utc);
+CREATE TABLE IF NOT EXISTS cursors (
+    listing TEXT PRIMARY KEY,
+    fullname TEXT
+);
+CREATE TABLE IF NOT EXISTS digests (
+    subreddit TEXT PRIMARY KEY,
+    digested_at REAL NOT NULL
+);
+"""
+
+
+class SeenIndex:
+    """Thread-safe, bounded set of seen post IDs per subreddit, persisted to SQLite.
+
+    Each post is stored once with a ``pending`` flag. New posts start pending,
+    and ``take_pending`` hands them out exactly once. For each subreddit, only
+    the newest ``max_per_subreddit`` posts that have already been digested are
+    kept; older ones are pruned. Pending posts are never pruned.
+    """
+
+    def __init__(self, path: str, max_per_subreddit: int = 1000):
+        self.path = path
+        self.max_per_subreddit = max(1, max_per_subreddit)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._stats = {"recorded": 0, "duplicates": 0, "taken": 0, "pruned": 0}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def known_subreddits(self) -> Set[str]:
+        """Return the subreddits that have at least one recorded post."""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT DISTINCT subreddit FROM posts")}
+
+    def newest_created(self) -> Dict[str, float]:
+        """Return the creation time of the newest recorded post per subreddit."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT subreddit, MAX(created_utc) FROM posts GROUP BY subreddit"))
+
+    def record(self, posts: Iterable[PostRecord], pending: bool = True) -> int:
+        """
+        Add posts not seen before.
+
+        Args:
+            posts: ``(subreddit, post_id, title, created_utc)`` tuples.
+            pending: Whether the new posts still need a digest.
+
+        Returns:
+            The number of posts that were new to the index.
+        """
+        rows = [(subreddit.lower(), post_id, title, created_utc, int(pending)) for subreddit, post_id, title, created_utc in posts]
+        if not rows:
+            return 0
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany("INSERT OR IGNORE INTO posts VALUES (?, ?, ?, ?, ?)", rows)
+            added = self._conn.total_changes - before
+            for subreddit in {row[0] for row in rows}:
+                self._prune(subreddit)
+            self._stats["recorded"] += added
+            self._stats["duplicates"] += len(rows) - added
+        return added
+
+    def take_pending(self, subreddit: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Return the titles of a subreddit's pending posts, oldest first, and mark them digested.
+
+        Args:
+            subreddit: Subreddit name.
+            limit: Maximum number of posts to hand out; the rest stay pending.
+        """
+        subreddit = subreddit.lower()
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT post_id, title FROM posts WHERE subreddit = ? AND pending = 1 ORDER BY created_utc LIMIT ?",
+                (subreddit, -1 if limit is None else limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE posts SET pending = 0 WHERE subreddit = ? AND post_id = ?",
+                [(subreddit, post_id) for post_id, _ in rows],
+            )
+            self._conn.execute("INSERT OR REPLACE INTO digests VALUES (?, ?)", (subreddit, time.time()))
+            self._prune(subreddit)
+            self._stats["taken"] += len(rows)
+        return [title for _, title in rows]
+
+    def last_digest(self, subreddit: str) -> Optional[float]:
+        """Return when the subreddit's pending posts were last taken (Unix time), if ever."""
+        with self._lock:
+            row = self._conn.execute("SELECT digested_at FROM digests WHERE subreddit = ?", (subreddit.lower(),)).fetchone()
+        return row[0] if row else None
+
+    def get_cursor(self, listing: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT fullname FROM cursors WHERE listing = ?", (listing,)).fetchone()
+        return row[0] if row else None
+
+    def set_cursor(self, listing: str, fullname: Optional[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO cursors VALUES (?, ?)", (listing, fullname))
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters plus the number of stored and pending posts."""
+        with self._lock:
+            stored, pending = self._conn.execute("SELECT COUNT(*), COALESCE(SUM(pending), 0) FROM posts").fetchone()
+            return {**self._stats, "stored": stored, "pending": pending}
+
+    def _prune(self, subreddit: str) -> None:
+        """Drop digested posts beyond the newest ``max_per_subreddit``; caller holds the lock."""
+        cursor = self._conn.execute(
+            """
+            DELETE FROM posts WHERE subreddit = ? AND pending = 0 AND post_id NOT IN (
+                SELECT post_id FROM posts WHERE subreddit = ? ORDER BY created_utc DESC LIMIT ?
+            )
+            """,
+            (subreddit, subreddit, self.max_per_subreddit),
+        )
+        self._stats["pruned"] += max(0, cursor.rowcount)
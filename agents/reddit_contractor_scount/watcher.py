@@ -0,0 +1,267 @@
+"""
+Incremental subreddit watcher for the contractor scout.
+Polls the watched subreddits' /new listing for posts newer than the last one
+seen and records them in a SeenIndex, so digests only cover new posts.
+"""
+
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from opentelemetry import trace
+
+from .reddit_client import SUBREDDIT_ERRORS, get_client_pool
+from .seen_index import PostRecord, SeenIndex
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+REDDIT_WATCH_DB = os.getenv("REDDIT_WATCH_DB", os.path.join(tempfile.gettempdir(), "reddit_watch.db"))
+REDDIT_WATCH_SUBREDDITS = [s.strip() for s in os.getenv("REDDIT_WATCH_SUBREDDITS", "").split(",") if s.strip()]
+# Seconds between background polls; 0 only polls when the tool is called
+REDDIT_WATCH_INTERVAL = float(os.getenv("REDDIT_WATCH_INTERVAL", "60"))
+# Posts treated as new the first time a subreddit is watched
+REDDIT_WATCH_BACKFILL = int(os.getenv("REDDIT_WATCH_BACKFILL", "10"))
+REDDIT_SEEN_MAX_PER_SUBREDDIT = int(os.getenv("REDDIT_SEEN_MAX_PER_SUBREDDIT", "1000"))
+
+# Largest page Reddit returns for a listing
+PAGE_SIZE = 100
+# Empty delta polls before the cursor is re-checked with a full page
+CURSOR_MAX_EMPTY_POLLS = 5
+
+
+class SubredditWatcher:
+    """Tracks new submissions across a set of subreddits.
+
+    A poll makes one listing request for all watched subreddits together
+    (``r/a+b+c/new``). The request asks only for posts newer than the newest
+    one already seen; that cursor is persisted in the index. Reddit also
+    returns an empty page when the cursor post has been deleted. So after
+    ``CURSOR_MAX_EMPTY_POLLS`` empty pages in a row, the next poll reads a
+    full page instead, and the index filters out posts it has already seen.
+    PRAW's ``stream.submissions`` does the same after every empty page.
+    A subreddit watched for the first time is backfilled with its newest
+    ``backfill`` posts.
+
+    Requested subreddits only join the watched set once a poll has read them.
+    One that cannot be read (non-existent, banned, private) is dropped with
+    its error instead, and is only tried again when it is requested again.
+    If the combined listing fails that way, each subreddit is polled on its
+    own so the others still get their posts.
+    """
+
+    def __init__(
+        self,
+        index: SeenIndex,
+        subreddits: Iterable[str] = (),
+        interval: float = REDDIT_WATCH_INTERVAL,
+        backfill: int = REDDIT_WATCH_BACKFILL,
+    ):
+        self.index = index
+        self.interval = interval
+        self.backfill = max(0, backfill)
+        self._subreddits: Set[str] = set()
+        # Requested but not read yet; validated by the next poll
+        self._candidates = {s.lower().removeprefix("r/") for s in subreddits}
+        self._errors: Dict[str, Exception] = {}
+        self._lock = threading.Lock()
+        self._poll_lock = threading.Lock()
+        self._last_poll: Optional[float] = None
+        self._empty_polls: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"polls": 0, "listing_requests": 0, "new_posts": 0, "poll_errors": 0, "unavailable": 0}
+
+    def watch(self, subreddits: Iterable[str]) -> None:
+        """Add subreddits to the watched set once the next poll has read them."""
+        with self._lock:
+            self._candidates.update(s.lower().removeprefix("r/") for s in subreddits)
+            self._candidates -= self._subreddits
+
+    def start(self) -> None:
+        """Start polling in a background thread (no-op if ``interval`` is 0 or already started)."""
+        with self._lock:
+            if self.interval <= 0 or self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="reddit-watcher", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def take_new(
+        self, subreddits: List[str], limit: Optional[int] = None
+    ) -> Tuple[Dict[str, List[str]], Dict[str, Exception]]:
+        """
+        Return the posts added since the last digest of each subreddit, marking them digested.
+
+        Polls first when a subreddit is not watched yet or the last poll is
+        older than ``interval`` (always, when background polling is off), so
+        the result is never staler than one poll interval.
+
+        Args:
+            subreddits: Subreddit names.
+            limit: Maximum titles per subreddit; any remainder stays pending.
+
+        Returns:
+            A ``(new_posts, errors)`` pair: subreddit name -> titles of its new
+            posts, oldest first, and subreddit name -> the error that kept it
+            from being read. Each name is in exactly one of them.
+
+        Raises:
+            Exception: If Reddit could not be reached at all.
+        """
+        names = [s.lower().removeprefix("r/") for s in subreddits]
+        with self._lock:
+            unwatched = set(names) - self._subreddits
+        self.watch(names)
+        if unwatched or self._last_poll is None or time.monotonic() - self._last_poll >= self.interval:
+            self.poll()
+        with self._lock:
+            errors = {name: self._errors[name] for name in names if name not in self._subreddits and name in self._errors}
+        new_posts = {name: self.index.take_pending(name, limit) for name in names if name not in errors}
+        return new_posts, errors
+
+    def poll(self) -> int:
+        """
+        Fetch posts newer than the last poll for every watched subreddit; returns how many were new.
+
+        Subreddits that cannot be read are dropped from the watched set
+        rather than failing the poll.
+        """
+        with self._poll_lock, tracer.start_as_current_span("reddit.watch.poll") as span:
+            with self._lock:
+                watched = self._subreddits | self._candidates
+                candidates = set(self._candidates)
+            span.set_attribute("reddit.subreddits", len(watched))
+            if not watched:
+                return 0
+            pool = get_client_pool()
+            if pool is None:
+                raise RuntimeError("Reddit API credentials are not set.")
+            errors: Dict[str, Exception] = {}
+            try:
+                known = self.index.known_subreddits()
+                with pool.client(timeout=30) as reddit:
+                    added = self._backfill(reddit, sorted(candidates - known), errors)
+                    added += self._poll_listings(reddit, sorted(watched - errors.keys()), errors)
+            except Exception:
+                with self._lock:
+                    self._stats["poll_errors"] += 1
+                raise
+            for name, error in errors.items():
+                logger.warning(f"Not watching r/{name}: {error}")
+            with self._lock:
+                self._candidates -= candidates
+                self._subreddits |= watched - errors.keys()
+                self._subreddits -= errors.keys()
+                for name in watched:
+                    self._errors.pop(name, None)
+                self._errors.update(errors)
+                self._stats["polls"] += 1
+                self._stats["new_posts"] += added
+                self._stats["unavailable"] += len(errors)
+            self._last_poll = time.monotonic()
+            span.set_attribute("reddit.new_posts", added)
+            return added
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            stats: Dict[str, object] = {
+                **self._stats,
+                "watched": sorted(self._subreddits),
+                "unavailable_subreddits": {name: str(error) for name, error in sorted(self._errors.items())},
+            }
+        stats["index"] = self.index.stats()
+        return stats
+
+    def _backfill(self, reddit, subreddits: List[str], errors: Dict[str, Exception]) -> int:
+        added = 0
+        for name in subreddits:
+            # Read even with no backfill, so a subreddit that cannot be read is caught here
+            try:
+                posts = list(reddit.subreddit(name).new(limit=self.backfill or 1))
+            except SUBREDDIT_ERRORS as e:
+                errors[name] = e
+                continue
+            finally:
+                self._count_request()
+            added += self.index.record(_records(posts), pending=bool(self.backfill))
+        return added
+
+    def _poll_listings(self, reddit, subreddits: List[str], errors: Dict[str, Exception]) -> int:
+        if not subreddits:
+            return 0
+        try:
+            return self._poll_listing(reddit, "+".join(subreddits))
+        except SUBREDDIT_ERRORS as e:
+            if len(subreddits) == 1:
+                errors[subreddits[0]] = e
+                return 0
+        # Find the subreddits that broke the combined listing; the rest are polled on their own this time
+        added = 0
+        for name in subreddits:
+            try:
+                added += self._poll_listing(reddit, name)
+            except SUBREDDIT_ERRORS as e:
+                errors[name] = e
+        return added
+
+    def _poll_listing(self, reddit, listing: str) -> int:
+        cursor = self.index.get_cursor(listing)
+        if self._empty_polls.get(listing, 0) >= CURSOR_MAX_EMPTY_POLLS:
+            cursor = None
+        params = {"before": cursor} if cursor else {}
+        posts = list(reddit.subreddit(listing).new(limit=PAGE_SIZE, params=params))
+        self._count_request()
+        # Listings are newest first
+        if posts:
+            self.index.set_cursor(listing, posts[0].fullname)
+        self._empty_polls[listing] = 0 if posts or not cursor else self._empty_polls.get(listing, 0) + 1
+        if cursor:
+            return self.index.record(_records(posts))
+
+        # Without a cursor the page reaches back past what earlier polls covered;
+        # only posts newer than a subreddit's newest known post count as new
+        newest = self.index.newest_created()
+        fresh, old = [], []
+        for record in _records(posts):
+            (fresh if record[3] > newest.get(record[0], float("-inf")) else old).append(record)
+        self.index.record(old, pending=False)
+        return self.index.record(fresh)
+
+    def _count_request(self) -> None:
+        with self._lock:
+            self._stats["listing_requests"] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.warning(f"Subreddit watcher poll failed: {e}")
+
+
+def _records(posts) -> List[PostRecord]:
+    return [(post.subreddit.display_name.lower(), post.id, post.title, float(post.created_utc)) for post in posts]
+
+
+_watcher: Optional[SubredditWatcher] = None
+_watcher_lock = threading.Lock()
+
+
+def get_subreddit_watcher() -> SubredditWatcher:
+    """Return the process-wide watcher, starting its background polling on first use."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            index = SeenIndex(REDDIT_WATCH_DB, max_per_subreddit=REDDIT_SEEN_MAX_PER_SUBREDDIT)
+            _watcher = SubredditWatcher(index, REDDIT_WATCH_SUBREDDITS)
+            _watcher.start()
+        return _watcher
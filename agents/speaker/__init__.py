@@ -1 +1,24 @@
-from .agent import root_agent
\ No newline at end of file
+"""
+Speaker agent package.
+``root_agent`` is built on first access, so importing the package (e.g. for
+``python -m speaker``) does not pull in the ADK stack.
+"""
+
+import os
+import sys
+
+# `adk web`/`adk api_server` only put agents/ on the path; `common` lives at the project root
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.append(PROJECT_ROOT)
+
+AGENT_NAME = "tts_speaker_agent"
+AGENT_DESCRIPTION = "Converts provided text into speech using ElevenLabs TTS MCP."
+
+
+def __getattr__(name):
+    if name == "root_agent":
+        from .agent import root_agent
+
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,23 +1,22 @@
 """
 Entry point for the Speaker Agent.
 Initializes and starts the agent's server.
+
+The server binds straight away; the ADK stack, the agent, the TaskManager and
+the TTS MCP server are brought up by a background warmup (see warmup.py) whose
+progress is reported at /ready.
 """
 
 import os
 import sys
 import logging
 import argparse
-import uvicorn
 import asyncio # Import asyncio
 from contextlib import AsyncExitStack # For MCP exit stack
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Request
-from pydantic import BaseModel
 
-# Use relative imports within the agent package
-from .task_manager import TaskManager # Add this import
-from .agent import root_agent # Import the coroutine
-from common.a2a_server import AgentRequest, AgentResponse, create_agent_server # Use the helper
+# Only the package constants here; heavy imports happen in main() and during warmup
+from . import AGENT_DESCRIPTION, AGENT_NAME
 
 # Configure logging
 logging.basicConfig(
@@ -31,8 +30,8 @@ logger = logging.getLogger(__name__)
 dotenv_path = os.path.join(os.path.dirname(__file__), '..', '..', '.env')
 load_status = load_dotenv(dotenv_path=dotenv_path, override=True) # Use override just in case
 
-# Global variable for the TaskManager instance
-task_manager_instance: TaskManager | None = None
+# Global variable for the TaskManager front; the real TaskManager is built during warmup
+task_manager_instance = None
 
 def parse_args():
     """Parse command line arguments."""
@@ -63,18 +62,24 @@ async def main(): # Make main async
     global task_manager_instance
     
     logger.info("Starting Speaker Agent A2A Server initialization...")
-    
-    # Await the root_agent coroutine to get the actual agent and exit_stack
-    logger.info("Awaiting root_agent creation...")
-    agent_instance, exit_stack = await root_agent
-    logger.info(f"Agent instance created: {agent_instance.name}")
 
-    # Use the exit_stack to manage the MCP connection lifecycle
-    async with exit_stack:
-        logger.info("MCP exit_stack entered.")
-        # Initialize the TaskManager with the resolved agent instance
-        task_manager_instance = TaskManager(agent=agent_instance)
-        logger.info("TaskManager initialized with agent instance.")
+    # Only what is needed to bind the server; the ADK stack loads during warmup
+    import uvicorn
+    from common.a2a_server import create_agent_server
+    from common.telemetry import monitor_event_loop_lag, render_prometheus, setup_telemetry
+    from .warmup import WarmingTaskManager
+
+    # Install tracing/metrics before the agent is built so ADK's spans are captured
+    setup_telemetry("speaker_agent")
+    loop_lag_task = asyncio.create_task(monitor_event_loop_lag())
+
+    # Stop the warmup and the pooled MCP servers when the server shuts down
+    async with AsyncExitStack() as exit_stack:
+        # Requests wait for (or are rejected during) warmup until the TaskManager exists
+        task_manager_instance = WarmingTaskManager()
+        exit_stack.push_async_callback(task_manager_instance.aclose)
+        task_manager_instance.start()
+        logger.info("Warmup started; the agent and TaskManager are built in the background.")
 
         # Configuration for the A2A server
         # Use environment variables or defaults
@@ -84,9 +89,10 @@ async def main(): # Make main async
         # Create the FastAPI app using the helper
         # Pass the agent name, description, and the task manager instance
         app = create_agent_server(
-            name=agent_instance.name,
-            description=agent_instance.description,
-            task_manager=task_manager_instance 
+            name=AGENT_NAME,
+            description=AGENT_DESCRIPTION,
+            task_manager=task_manager_instance,
+            metrics_renderer=render_prometheus,
         )
         
         logger.info(f"Speaker Agent A2A server starting on {host}:{port}")
@@ -99,6 +105,7 @@ async def main(): # Make main async
         await server.serve()
         
         # This part will be reached after the server is stopped (e.g., Ctrl+C)
+        loop_lag_task.cancel()
         logger.info("Speaker Agent A2A server stopped.")
 
 if __name__ == "__main__":
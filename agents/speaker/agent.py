@@ -1,5 +1,54 @@
 import os
 from dotenv import load_dotenv
+from google.adk.agents import Agent
+from google.adk.models.lite_llm import LiteLlm
+from google.adk.tools.mcp_tool.mcp_session_manager import SseServerParams
+from mcp import StdioServerParameters
+
+from common.mcp_pool import get_mcp_pool
+from . import AGENT_DESCRIPTION, AGENT_NAME, PROJECT_ROOT
 
 # Load environment variables from the project root .env file
-load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", "..", ".env"))
+load_dotenv(dotenv_path=os.path.join(PROJECT_ROOT, ".env"))
+
+# Point every process at one long-running ElevenLabs MCP server (SSE) instead of spawning one each
+ELEVENLABS_MCP_URL = os.getenv("ELEVENLABS_MCP_URL")
+# Voice the agent asks for; the TaskManager keys its audio cache on the same setting
+SPEAKER_VOICE = os.getenv("SPEAKER_VOICE", "Will")
+
+
+def _elevenlabs_connection():
+    if ELEVENLABS_MCP_URL:
+        return SseServerParams(url=ELEVENLABS_MCP_URL)
+    return StdioServerParameters(
+        command="uvx",
+        args=["elevenlabs-mcp"],
+        env={"ELEVENLABS_API_KEY": os.environ.get("ELEVENLABS_API_KEY", "")},
+    )
+
+
+def create_agent():
+    """Build the speaker agent. Its ElevenLabs MCP server is shared and only starts on first use."""
+    pool = get_mcp_pool()
+    pool.register("elevenlabs", _elevenlabs_connection())
+    llm = LiteLlm(model="gemini/gemini-1.5-flash-latest", api_key=os.environ.get("GOOGLE_API_KEY"))
+    agent_instance = Agent(
+        name=AGENT_NAME,
+        description=AGENT_DESCRIPTION,
+        instruction=(
+            "You are a Text-to-Speech agent. Convert user text to speech audio files.\n\n"
+            "IMPORTANT FORMATTING RULES:\n"
+            f"1. Always call the text_to_speech tool with voice_name='{SPEAKER_VOICE}'\n"
+            "2. When the tool returns a file path, format your response like this example:\n"
+            "   'I've converted your text to speech. The audio file is saved at `/path/to/file.mp3`'\n"
+            "3. Make sure to put ONLY the file path inside backticks (`), not any additional text\n"
+            "4. Never modify or abbreviate the path\n\n"
+            "This exact format is critical for proper processing."
+        ),
+        model=llm,
+        tools=[pool.toolset("elevenlabs")],
+    )
+    return agent_instance
+
+
+root_agent = create_agent()
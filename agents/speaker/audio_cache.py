@@ -0,0 +1,219 @@
+"""
+Content-addressed cache for synthesized speech.
+Maps (normalized text, voice) to an audio file under AUDIO_OUTPUT_DIR.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+import unicodedata
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "index.json"
+
+# Write last-access times back to disk at most this often on cache hits
+INDEX_FLUSH_INTERVAL = 30.0
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text so trivially different inputs share one cache entry."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+class AudioCache:
+    """On-disk TTS cache with an index that survives restarts.
+
+    Entries are evicted when older than ``max_age`` seconds, and least recently
+    used entries are dropped once the cache exceeds ``max_bytes``. Concurrent
+    requests for the same key share a single in-flight synthesis.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, max_age: float):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._index_path = os.path.join(self.cache_dir, INDEX_FILENAME)
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._last_flush = time.time()
+        self._stats = {"hits": 0, "misses": 0, "shared": 0, "evictions": 0}
+        self._entries: Dict[str, Dict[str, Any]] = self._load_index()
+
+    @staticmethod
+    def make_key(text: str, voice: str) -> str:
+        """Return the content hash identifying one synthesis."""
+        payload = json.dumps([normalize_text(text), voice], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, count_miss: bool = True) -> Optional[str]:
+        """Return the cached audio path for ``key``, or None on a miss.
+
+        Touches the filesystem (and periodically rewrites the index), so async
+        callers should run it in a thread. ``count_miss=False`` leaves a miss
+        out of the stats, for lookups the caller repeats before synthesizing.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += count_miss
+                return None
+            if now - entry["created"] > self.max_age or not os.path.exists(entry["path"]):
+                self._remove(key)
+                self._save_index()
+                self._stats["misses"] += count_miss
+                return None
+            entry["last_access"] = now
+            self._stats["hits"] += 1
+            if now - self._last_flush > INDEX_FLUSH_INTERVAL:
+                self._save_index()
+            return entry["path"]
+
+    def put(self, key: str, source_path: str) -> str:
+        """
+        Copy a freshly synthesized file into the cache.
+
+        Args:
+            key: Cache key from ``make_key``.
+            source_path: Path of the generated audio file.
+
+        Returns:
+            The path of the cached copy.
+        """
+        extension = os.path.splitext(source_path)[1] or ".mp3"
+        cached_path = os.path.join(self.cache_dir, f"{key}{extension}")
+        if os.path.abspath(source_path) != os.path.abspath(cached_path):
+            # Copy under a temporary name so readers never see a partial file
+            tmp_path = f"{cached_path}.tmp"
+            shutil.copyfile(source_path, tmp_path)
+            os.replace(tmp_path, cached_path)
+
+        now = time.time()
+        with self._lock:
+            self._entries[key] = {
+                "path": cached_path,
+                "size": os.path.getsize(cached_path),
+                "created": now,
+                "last_access": now,
+            }
+            self._evict(now)
+            self._save_index()
+            # A single file larger than max_bytes is evicted immediately
+            return cached_path if key in self._entries else source_path
+
+    async def get_or_wait(self, key: str, count_miss: bool = True) -> Optional[str]:
+        """
+        Return the cached path for ``key``, waiting for a synthesis of it that is already running.
+
+        Returns None on a miss, or if the running synthesis failed. Unlike
+        ``get_or_create`` this never claims the key, so callers can do so
+        later, e.g. once a scheduler has admitted them.
+        """
+        # The lookup stats the file and may rewrite the index, so it stays off the event loop
+        path = await asyncio.to_thread(self.get, key, count_miss)
+        if path:
+            return path
+        pending = self._inflight.get(key)
+        if pending is None:
+            return None
+        self._stats["shared"] += 1
+        return await asyncio.shield(pending)
+
+    async def get_or_create(
+        self, key: str, create: Callable[[], Awaitable[Optional[str]]]
+    ) -> tuple[Optional[str], bool]:
+        """
+        Return the cached path for ``key``, running ``create`` once on a miss.
+
+        Callers that arrive while a synthesis for the same key is running wait
+        for it instead of starting their own. If that synthesis fails, they get
+        ``(None, False)`` and may try again themselves.
+
+        Args:
+            key: Cache key from ``make_key``.
+            create: Coroutine factory that synthesizes audio and returns its path
+                (or None on failure).
+
+        Returns:
+            ``(path, created)``: the audio path (None if synthesis failed) and
+            whether this call ran ``create`` itself.
+        """
+        # The lookup stats the file and may rewrite the index, so it stays off the event loop
+        path = await asyncio.to_thread(self.get, key)
+        if path:
+            return path, False
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._stats["shared"] += 1
+            return await asyncio.shield(pending), False
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        path = None
+        try:
+            source_path = await create()
+            if source_path and os.path.exists(source_path):
+                path = await asyncio.to_thread(self.put, key, source_path)
+            return path, True
+        finally:
+            del self._inflight[key]
+            future.set_result(path)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters and the cache footprint."""
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._entries),
+                "bytes": sum(entry["size"] for entry in self._entries.values()),
+                "inflight": len(self._inflight),
+            }
+
+    def _evict(self, now: float) -> None:
+        for key in [k for k, e in self._entries.items() if now - e["created"] > self.max_age]:
+            self._remove(key)
+        total = sum(entry["size"] for entry in self._entries.values())
+        for key in sorted(self._entries, key=lambda k: self._entries[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= self._entries[key]["size"]
+            self._remove(key)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._stats["evictions"] += 1
+        try:
+            os.remove(entry["path"])
+        except FileNotFoundError:
+            pass
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable audio cache index {self._index_path}: {e}")
+            return {}
+        # Drop entries whose files were removed while the process was down
+        return {key: entry for key, entry in entries.items() if os.path.exists(entry.get("path", ""))}
+
+    def _save_index(self) -> None:
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f)
+        os.replace(tmp_path, self._index_path)
+        self._last_flush = time.time()
@@ -0,0 +1,75 @@
+"""
+Sentence-boundary text chunking for pipelined text-to-speech.
+"""
+
+import re
+from typing import List
+
+from .audio_cache import normalize_text
+
+# A sentence ends at . ! ? (optionally followed by a closing quote or bracket)
+# when the next sentence starts with a capital letter, digit or opening quote
+SENTENCE_BOUNDARY = re.compile(r"(?:(?<=[.!?])|(?<=[.!?][\"')\]]))\s+(?=[\"'(\[]?[A-Z0-9])")
+CLAUSE_BOUNDARY = re.compile(r"(?<=[,;:])\s+")
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences, keeping their punctuation."""
+    text = normalize_text(text)
+    if not text:
+        return []
+    return [sentence for sentence in SENTENCE_BOUNDARY.split(text) if sentence]
+
+
+def _split_long(sentence: str, max_chars: int) -> List[str]:
+    """Break a sentence longer than ``max_chars`` at clause boundaries, then at spaces."""
+    pieces: List[str] = []
+    current = ""
+    for part in CLAUSE_BOUNDARY.split(sentence):
+        for word in part.split(" ") if len(part) > max_chars else [part]:
+            if current and len(current) + 1 + len(word) > max_chars:
+                pieces.append(current)
+                current = word
+            else:
+                current = f"{current} {word}" if current else word
+        # Prefer ending a piece at a clause boundary once it is reasonably full
+        if len(current) >= max_chars // 2:
+            pieces.append(current)
+            current = ""
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def chunk_text(text: str, max_chars: int) -> List[str]:
+    """
+    Group sentences into chunks of at most ``max_chars`` characters.
+
+    The first chunk is always a single sentence so the first audio segment
+    is ready as early as possible; later sentences are packed together to
+    keep the number of TTS calls down.
+
+    Args:
+        text: The text to synthesize.
+        max_chars: Upper bound on a chunk's length.
+
+    Returns:
+        The chunks in reading order.
+    """
+    sentences: List[str] = []
+    for sentence in split_sentences(text):
+        sentences.extend(_split_long(sentence, max_chars) if len(sentence) > max_chars else [sentence])
+    if not sentences:
+        return []
+
+    chunks = [sentences[0]]
+    current = ""
+    for sentence in sentences[1:]:
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
@@ -0,0 +1,220 @@
+"""
+Session backends for the Speaker Agent's A2A TaskManager.
+Provides a bounded in-memory store and a SQLite/SQLAlchemy-backed persistent store.
+"""
+
+import logging
+import os
+import resource
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import func, select
+from google.adk.events import Event
+from google.adk.sessions import BaseSessionService, InMemorySessionService, Session
+from google.adk.sessions.base_session_service import GetSessionConfig
+from google.adk.sessions.database_session_service import DatabaseSessionService, StorageSession
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[str, str, str]  # (app_name, user_id, session_id)
+
+
+def _rss_bytes() -> int:
+    """Current resident set size of this process (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is KiB on Linux, bytes on macOS; only used as a fallback
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class BoundedInMemorySessionService(InMemorySessionService):
+    """In-memory session service with LRU and idle-TTL eviction.
+
+    At most ``max_sessions`` sessions are kept; creating one more evicts the
+    least recently used. Sessions untouched for ``idle_ttl`` seconds are evicted
+    on the next access to the service. ``on_evict`` is called with
+    ``(app_name, user_id, session_id)`` so callers can release related state
+    such as artifacts.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        idle_ttl: float = 3600.0,
+        on_evict: Optional[Callable[[str, str, str], None]] = None,
+    ):
+        super().__init__()
+        self.max_sessions = max(1, max_sessions)
+        self.idle_ttl = idle_ttl
+        self.on_evict = on_evict
+        self._last_access: "OrderedDict[SessionKey, float]" = OrderedDict()
+        self._evictions = {"lru": 0, "idle": 0}
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        self._evict_idle()
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._touch((app_name, user_id, session.id))
+        while len(self._last_access) > self.max_sessions:
+            key, _ = self._last_access.popitem(last=False)
+            self._evict(key, "lru")
+        return session
+
+    async def get_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        session_id: str,
+        config: Optional[GetSessionConfig] = None,
+    ) -> Optional[Session]:
+        self._evict_idle()
+        session = await super().get_session(
+            app_name=app_name, user_id=user_id, session_id=session_id, config=config
+        )
+        if session is not None:
+            self._touch((app_name, user_id, session_id))
+        return session
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        self._last_access.pop((app_name, user_id, session_id), None)
+
+    async def append_event(self, session: Session, event: Event) -> Event:
+        event = await super().append_event(session=session, event=event)
+        key = (session.app_name, session.user_id, session.id)
+        if key in self._last_access:
+            self._touch(key)
+        return event
+
+    def stats(self) -> Dict[str, Any]:
+        """Return session counts, eviction counters and process memory."""
+        event_count = sum(
+            len(session.events)
+            for users in self.sessions.values()
+            for sessions in users.values()
+            for session in sessions.values()
+        )
+        return {
+            "backend": "memory",
+            "session_count": len(self._last_access),
+            "event_count": event_count,
+            "max_sessions": self.max_sessions,
+            "idle_ttl": self.idle_ttl,
+            "evicted_lru": self._evictions["lru"],
+            "evicted_idle": self._evictions["idle"],
+            "rss_bytes": _rss_bytes(),
+        }
+
+    def _touch(self, key: SessionKey) -> None:
+        self._last_access[key] = time.monotonic()
+        self._last_access.move_to_end(key)
+
+    def _evict_idle(self) -> None:
+        cutoff = time.monotonic() - self.idle_ttl
+        # Oldest entries are at the front, so stop at the first recent one
+        while self._last_access:
+            key, last_access = next(iter(self._last_access.items()))
+            if last_access > cutoff:
+                break
+            del self._last_access[key]
+            self._evict(key, "idle")
+
+    def _evict(self, key: SessionKey, reason: str) -> None:
+        app_name, user_id, session_id = key
+        users = self.sessions.get(app_name, {})
+        sessions = users.get(user_id, {})
+        sessions.pop(session_id, None)
+        if not sessions:
+            users.pop(user_id, None)
+        self._evictions[reason] += 1
+        logger.debug(f"Evicted session {session_id} ({reason})")
+        if self.on_evict:
+            self.on_evict(app_name, user_id, session_id)
+
+
+class PersistentSessionService(DatabaseSessionService):
+    """ADK's SQLAlchemy session service with the same ``stats()`` as the in-memory store.
+
+    Sessions live in the database, so process memory stays flat regardless
+    of how many sessions exist, and state survives restarts.
+
+    The session count is read from the database once, at startup, and then
+    tracked by ``create_session``/``delete_session``, so ``stats()`` (served
+    from the event loop) never queries the database. Sessions written by
+    other replicas after startup are not included.
+    """
+
+    def __init__(self, db_url: str, **kwargs: Any):
+        super().__init__(db_url, **kwargs)
+        with self.database_session_factory() as db:
+            self._session_count = db.scalar(select(func.count()).select_from(StorageSession)) or 0
+
+    async def create_session(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        state: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+    ) -> Session:
+        session = await super().create_session(
+            app_name=app_name, user_id=user_id, state=state, session_id=session_id
+        )
+        self._session_count += 1
+        return session
+
+    async def delete_session(self, *, app_name: str, user_id: str, session_id: str) -> None:
+        await super().delete_session(app_name=app_name, user_id=user_id, session_id=session_id)
+        self._session_count = max(0, self._session_count - 1)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the session count and process memory."""
+        return {
+            "backend": self.db_engine.dialect.name,
+            "session_count": self._session_count,
+            "rss_bytes": _rss_bytes(),
+        }
+
+
+def create_session_service(
+    backend: str,
+    db_url: Optional[str] = None,
+    max_sessions: int = 1000,
+    idle_ttl: float = 3600.0,
+    on_evict: Optional[Callable[[str, str, str], None]] = None,
+) -> BaseSessionService:
+    """
+    Build the session service for the configured backend.
+
+    Args:
+        backend: 'memory' for the bounded in-memory store, or 'sqlite'/'database'
+            for the persistent SQLAlchemy store shared across restarts and replicas.
+        db_url: SQLAlchemy database URL, required for the persistent backend.
+        max_sessions: LRU bound for the in-memory backend.
+        idle_ttl: Idle eviction timeout in seconds for the in-memory backend.
+        on_evict: Callback for sessions evicted from the in-memory backend.
+
+    Returns:
+        A session service instance.
+    """
+    backend = backend.lower()
+    if backend == "memory":
+        return BoundedInMemorySessionService(max_sessions=max_sessions, idle_ttl=idle_ttl, on_evict=on_evict)
+    if backend in ("sqlite", "database"):
+        if not db_url:
+            raise ValueError(f"A database URL is required for the '{backend}' session backend.")
+        return PersistentSessionService(db_url)
+    raise ValueError(f"Unknown session backend '{backend}'. Use 'memory' or 'sqlite'.")
@@ -4,35 +4,175 @@ Handles text-to-speech conversion using the ADK Runner.
 """
 
 import os
+import re
+import asyncio
 import logging
 import tempfile
 import uuid
-from typing import Dict, Any, Optional
+from collections import deque
+from contextlib import aclosing, asynccontextmanager
+from typing import Dict, Any, AsyncIterator, Iterator, List, Optional
 
+from opentelemetry import metrics, trace
+from opentelemetry.metrics import Observation
+from pydantic_core import to_jsonable_python
 from google.adk.agents import Agent
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
-from google.adk.sessions import InMemorySessionService
 from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
 from google.genai import types as adk_types
 
+from common.a2a_server import TaskRejectedError
+from common.mcp_pool import get_mcp_pool
+from .audio_cache import AudioCache
+from .chunking import chunk_text
+from .session_store import create_session_service
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Spans and instruments are no-ops until common.telemetry installs providers
+tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter(__name__)
+request_duration = meter.create_histogram(
+    "speaker.request.duration", unit="s", description="End-to-end request latency, including queueing"
+)
+queue_wait = meter.create_histogram(
+    "speaker.queue.wait", unit="s", description="Time spent waiting for a scheduler slot"
+)
+request_outcomes = meter.create_counter("speaker.requests", description="Requests by outcome")
+
 # Define app name for the runner
 A2A_APP_NAME = "speaker_a2a_app"
+# User that requests without a user_id in their context run as
+DEFAULT_USER_ID = "default_a2a_user"
+
+# Scheduler defaults, overridable per instance or via environment
+DEFAULT_MAX_IN_FLIGHT = int(os.getenv("SPEAKER_MAX_IN_FLIGHT", "4"))
+DEFAULT_MAX_QUEUE = int(os.getenv("SPEAKER_MAX_QUEUE", "16"))
+DEFAULT_REQUEST_TIMEOUT = float(os.getenv("SPEAKER_REQUEST_TIMEOUT", "120"))
+
+# Session backend: 'memory' (bounded, per process) or 'sqlite' (persistent)
+SESSION_BACKEND = os.getenv("SPEAKER_SESSION_BACKEND", "memory")
+SESSION_DB_URL = os.getenv("SPEAKER_SESSION_DB_URL")
+MAX_SESSIONS = int(os.getenv("SPEAKER_MAX_SESSIONS", "1000"))
+SESSION_IDLE_TTL = float(os.getenv("SPEAKER_SESSION_IDLE_TTL", "3600"))
+
+# TTS audio cache, stored under AUDIO_OUTPUT_DIR
+TTS_CACHE_ENABLED = os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true"
+TTS_CACHE_MAX_BYTES = int(float(os.getenv("TTS_CACHE_MAX_MB", "512")) * 1024 * 1024)
+TTS_CACHE_MAX_AGE = float(os.getenv("TTS_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+
+# Voice for synthesis, and part of each cache entry's key. The TTS model and
+# output format are whatever the TTS server uses; clear the cache after changing them
+DEFAULT_VOICE = os.getenv("SPEAKER_VOICE", "Will")
+
+# Tools whose function responses carry the synthesized audio file
+TTS_TOOL_NAMES = {name.strip() for name in os.getenv("SPEAKER_TTS_TOOLS", "text_to_speech").split(",") if name.strip()}
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".ogg", ".flac", ".m4a")
+AUDIO_PATH_PATTERN = re.compile(r"(/[^\s'\"`]+?\.(?:mp3|wav|ogg|flac|m4a))\b", re.IGNORECASE)
+
+# Chunked TTS: split text at sentence boundaries and synthesize the pieces concurrently,
+# calling the agent's TTS tool directly instead of running the LLM
+CHUNKED_TTS = os.getenv("SPEAKER_CHUNKED_TTS", "false").lower() == "true"
+CHUNK_MAX_CHARS = int(os.getenv("SPEAKER_CHUNK_MAX_CHARS", "400"))
+CHUNK_CONCURRENCY = int(os.getenv("SPEAKER_CHUNK_CONCURRENCY", "3"))
+CHUNK_RETRIES = 1
+
+# Number of trailing events echoed back in data.raw_events
+DEFAULT_EVENT_ECHO_SIZE = int(os.getenv("SPEAKER_EVENT_ECHO_SIZE", "3"))
+
+# Number of recent latency samples kept for percentile reporting
+LATENCY_WINDOW = 1024
+
+
+def _percentile(samples: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of ``samples`` (0 < q <= 100), in milliseconds."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return round(ordered[index] * 1000, 1)
+
+
+def _iter_strings(value: Any) -> Iterator[str]:
+    """Yield every string nested in a JSON-like structure."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _iter_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_strings(item)
+
+
+def _audio_path_from_response(response: Any) -> Optional[str]:
+    """
+    Find the saved audio file in a TTS tool's function response.
+
+    The ElevenLabs MCP tool reports e.g. ``"Success. File saved as: /tmp/x.mp3."``
+    inside ``result.content[].text``; any absolute audio path in the payload counts.
+    """
+    for text in _iter_strings(to_jsonable_python(response, fallback=str)):
+        match = AUDIO_PATH_PATTERN.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _concat_files(paths: List[str], destination: str) -> None:
+    """Concatenate audio segments; MP3 frames are self-contained, so this yields a playable file."""
+    with open(destination, "wb") as out:
+        for path in paths:
+            with open(path, "rb") as segment:
+                out.write(segment.read())
+
 
 class TaskManager:
     """Task Manager for the Speaker Agent in A2A mode."""
     
-    def __init__(self, agent: Agent):
-        """Initialize with an Agent instance and set up ADK Runner."""
+    def __init__(
+        self,
+        agent: Agent,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ):
+        """
+        Initialize with an Agent instance and set up ADK Runner.
+
+        Args:
+            agent: The agent to run.
+            max_in_flight: Maximum number of agent turns running concurrently.
+            max_queue: Maximum number of requests waiting for a slot; beyond
+                this, requests are rejected with HTTP 429.
+            request_timeout: Default per-request deadline in seconds, covering
+                both queueing and execution.
+        """
         logger.info(f"Initializing TaskManager for agent: {agent.name}")
         self.agent = agent
         
+        # Set up output directory for audio files
+        self.output_dir = os.getenv("AUDIO_OUTPUT_DIR", os.path.join(tempfile.gettempdir(), "audio_output"))
+        os.makedirs(self.output_dir, exist_ok=True)
+
         # Initialize ADK services
-        self.session_service = InMemorySessionService()
         self.artifact_service = InMemoryArtifactService()
+        self.session_service = create_session_service(
+            SESSION_BACKEND,
+            db_url=SESSION_DB_URL or f"sqlite:///{os.path.join(self.output_dir, 'speaker_sessions.db')}",
+            max_sessions=MAX_SESSIONS,
+            idle_ttl=SESSION_IDLE_TTL,
+            on_evict=self._release_session_artifacts,
+        )
+        logger.info(f"Session backend: {SESSION_BACKEND}")
         
         # Create the runner
         self.runner = Runner(
@@ -43,35 +183,608 @@ class TaskManager:
         )
         logger.info(f"ADK Runner initialized for app '{self.runner.app_name}'")
         
-        # Set up output directory for audio files
-        self.output_dir = os.getenv("AUDIO_OUTPUT_DIR", os.path.join(tempfile.gettempdir(), "audio_output"))
-        os.makedirs(self.output_dir, exist_ok=True)
+        # Identical text is served from disk without an LLM or TTS call
+        self.audio_cache = (
+            AudioCache(os.path.join(self.output_dir, "tts_cache"), TTS_CACHE_MAX_BYTES, TTS_CACHE_MAX_AGE)
+            if TTS_CACHE_ENABLED
+            else None
+        )
+
+        # Scheduler state: a semaphore caps concurrent turns, the counters
+        # bound how many requests may wait for it
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max(0, max_queue)
+        self.request_timeout = request_timeout
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        self._in_flight = 0
+        self._waiting = 0
+        self._counters = {
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "expired_in_queue": 0,
+            "timed_out": 0,
+            "cancelled": 0,
+            "tts_syntheses": 0,
+        }
+        self._tts_tool = None
+        # Pre-created sessions handed to requests that arrive without a session_id
+        self._spare_sessions: deque = deque()
+        self._spare_target = 0
+        self._refill_task: Optional[asyncio.Task] = None
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self._queue_waits: deque = deque(maxlen=LATENCY_WINDOW)
+        meter.create_observable_gauge(
+            "speaker.in_flight", callbacks=[lambda options: [Observation(self._in_flight)]],
+            description="Agent turns currently running",
+        )
+        meter.create_observable_gauge(
+            "speaker.queue.depth", callbacks=[lambda options: [Observation(self._waiting)]],
+            description="Requests waiting for a scheduler slot",
+        )
+        logger.info(
+            f"Scheduler configured: max_in_flight={self.max_in_flight}, "
+            f"max_queue={self.max_queue}, request_timeout={self.request_timeout}s"
+        )
+
+    @asynccontextmanager
+    async def _admit(self, deadline: float):
+        """
+        Reserve an execution slot, queueing until one frees up or ``deadline`` passes.
+
+        Raises:
+            TaskRejectedError: 429 if the queue is full, 503 if no slot freed up in time.
+        """
+        loop = asyncio.get_running_loop()
+        if self._in_flight + self._waiting >= self.max_in_flight + self.max_queue:
+            self._counters["rejected"] += 1
+            request_outcomes.add(1, {"outcome": "rejected"})
+            raise TaskRejectedError(429, "Speaker is at capacity, please retry shortly.", retry_after=1)
+
+        self._waiting += 1
+        queued_at = loop.time()
+        try:
+            with tracer.start_as_current_span("speaker.queue_wait"):
+                await asyncio.wait_for(self._slots.acquire(), timeout=max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            self._counters["expired_in_queue"] += 1
+            request_outcomes.add(1, {"outcome": "expired_in_queue"})
+            raise TaskRejectedError(503, "Speaker could not schedule the request before its deadline.", retry_after=5)
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        self._queue_waits.append(loop.time() - queued_at)
+        queue_wait.record(loop.time() - queued_at)
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return queue depth, in-flight count, outcome counters and latency percentiles."""
+        latencies = list(self._latencies)
+        queue_waits = list(self._queue_waits)
+        return {
+            "in_flight": self._in_flight,
+            "queue_depth": self._waiting,
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            **self._counters,
+            "latency_ms": {
+                "p50": _percentile(latencies, 50),
+                "p95": _percentile(latencies, 95),
+                "p99": _percentile(latencies, 99),
+                "max": _percentile(latencies, 100),
+            },
+            "queue_wait_ms": {
+                "p50": _percentile(queue_waits, 50),
+                "p95": _percentile(queue_waits, 95),
+                "max": _percentile(queue_waits, 100),
+            },
+            "audio_cache": self.audio_cache.stats() if self.audio_cache else None,
+            "sessions": self.session_service.stats() if hasattr(self.session_service, "stats") else None,
+            "spare_sessions": len(self._spare_sessions),
+            "mcp_servers": get_mcp_pool().stats(),
+        }
+
+    async def prewarm_sessions(self, count: int) -> int:
+        """
+        Create ``count`` empty sessions for the default user ahead of time.
+
+        Requests without a session_id take one of these instead of creating a
+        session on the request path; the pool is topped back up in the background.
+
+        Returns:
+            The number of spare sessions available.
+        """
+        self._spare_target = max(0, count)
+        await self._refill_spare_sessions()
+        return len(self._spare_sessions)
+
+    async def _refill_spare_sessions(self) -> None:
+        while len(self._spare_sessions) < self._spare_target:
+            session = await self.session_service.create_session(app_name=A2A_APP_NAME, user_id=DEFAULT_USER_ID, state={})
+            self._spare_sessions.append(session.id)
+
+    def _take_spare_session(self) -> Optional[str]:
+        if not self._spare_sessions:
+            return None
+        session_id = self._spare_sessions.popleft()
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill_spare_sessions())
+            self._refill_task.add_done_callback(self._log_refill_failure)
+        return session_id
+
+    @staticmethod
+    def _log_refill_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Refilling spare sessions failed: {task.exception()}")
+
+    def _release_session_artifacts(self, app_name: str, user_id: str, session_id: str) -> None:
+        """Drop in-memory artifacts belonging to an evicted session."""
+        prefix = f"{app_name}/{user_id}/{session_id}/"
+        for path in [p for p in self.artifact_service.artifacts if p.startswith(prefix)]:
+            del self.artifact_service.artifacts[path]
+
+    def _audio_cache_key(self, message: str, context: Dict[str, Any]) -> Optional[str]:
+        """Return the TTS cache key for a request, or None if caching does not apply."""
+        if self.audio_cache is None or context.get("cache") is False:
+            return None
+        return AudioCache.make_key(message, voice=self._synthesis_voice(context))
+
+    def _synthesis_voice(self, context: Dict[str, Any]) -> str:
+        """Return the voice a request is synthesized with.
+
+        Chunked synthesis calls the TTS tool directly with ``context["voice"]``;
+        the agent path always uses the voice its instruction names (SPEAKER_VOICE).
+        """
+        if self._chunked(context):
+            return context.get("voice") or DEFAULT_VOICE
+        return DEFAULT_VOICE
+
+    @staticmethod
+    def _cached_result(audio_path: str, session_id: Optional[str]) -> Dict[str, Any]:
+        audio_url = f"file://{audio_path}"
+        return {
+            "message": f"I've converted your text to speech. The audio file is saved at `{audio_path}`",
+            "status": "success",
+            "data": {"audio_url": audio_url, "audio_path": audio_path, "cached": True},
+            "session_id": session_id,
+        }
 
     async def process_task(self, message: str, context: Dict[str, Any], session_id: Optional[str] = None) -> Dict[str, Any]:
         """
-        Process an A2A task request by running the agent.
-        
+        Process an A2A task request, subject to the scheduler's limits.
+
+        Text that was already synthesized with the same voice is answered
+        from the audio cache without running the agent. Otherwise
+        the request waits for a free slot, then runs the agent; concurrent
+        requests for the same text share that one run. The deadline
+        (``context["timeout"]`` seconds, or the manager default) covers both.
+        Cancelling the calling task (e.g. on client disconnect) cancels the run.
+
         Args:
             message: The text message to process.
-            context: Additional context data.
+            context: Additional context data. Recognized keys: ``user_id``,
+                ``timeout`` (seconds), ``echo_events`` (False omits
+                ``data.raw_events`` from the response), ``cache`` (False
+                bypasses the audio cache), ``chunked`` (synthesize sentence
+                chunks concurrently and concatenate them; defaults to
+                SPEAKER_CHUNKED_TTS) and ``voice`` (chunked mode only; the
+                agent uses SPEAKER_VOICE).
             session_id: Session identifier (generated if None).
-            
+
         Returns:
             Response dict with message, status, and data.
+
+        Raises:
+            TaskRejectedError: If the request cannot be admitted.
+        """
+        with tracer.start_as_current_span("speaker.process_task") as span:
+            span.set_attribute("speaker.cache_hit", False)
+            cache_key = self._audio_cache_key(message, context)
+            if cache_key is not None:
+                # Wait without a slot for a synthesis that is already running; the
+                # key is only claimed once admitted (see _run_shared)
+                audio_path = await self.audio_cache.get_or_wait(cache_key, count_miss=False)
+                if audio_path:
+                    span.set_attribute("speaker.cache_hit", True)
+                    request_outcomes.add(1, {"outcome": "cache_hit"})
+                    logger.info(f"Serving cached audio for session {session_id}: {audio_path}")
+                    return self._cached_result(audio_path, session_id)
+            return await self._process_uncached(message, context, session_id, cache_key)
+
+    async def _process_uncached(
+        self, message: str, context: Dict[str, Any], session_id: Optional[str], cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Run the agent for one request under the scheduler's admission and deadline."""
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        timeout = float(context.get("timeout") or self.request_timeout)
+        deadline = started + timeout
+
+        async with self._admit(deadline):
+            try:
+                run = self._run_chunked if self._chunked(context) else self._run_task
+                if cache_key is None:
+                    work = run(message, context, session_id)
+                else:
+                    work = self._run_shared(run, message, context, session_id, cache_key)
+                result = await asyncio.wait_for(work, timeout=max(0.0, deadline - loop.time()))
+            except asyncio.TimeoutError:
+                self._counters["timed_out"] += 1
+                request_outcomes.add(1, {"outcome": "timed_out"})
+                logger.warning(f"Task exceeded its {timeout:g}s deadline")
+                return {
+                    "message": f"Error processing your request: timed out after {timeout:g}s",
+                    "status": "error",
+                    "data": {"error_type": "TimeoutError"},
+                }
+            except asyncio.CancelledError:
+                self._counters["cancelled"] += 1
+                request_outcomes.add(1, {"outcome": "cancelled"})
+                raise
+
+        outcome = "completed" if result.get("status") == "success" else "failed"
+        self._latencies.append(loop.time() - started)
+        self._counters[outcome] += 1
+        request_duration.record(loop.time() - started, {"mode": "run", "outcome": outcome})
+        request_outcomes.add(1, {"outcome": outcome})
+        return result
+
+    async def _run_shared(self, run, message: str, context: Dict[str, Any], session_id: Optional[str], cache_key: str) -> Dict[str, Any]:
+        """
+        Run ``run`` as the single synthesis of ``cache_key``, or reuse the one already running.
+
+        Called with a scheduler slot held. Every in-flight synthesis therefore
+        belongs to an admitted request, and a request (or one of its chunks)
+        never waits on one that is still queued behind it.
+        """
+        leader_result: Dict[str, Any] = {}
+
+        async def synthesize() -> Optional[str]:
+            leader_result.update(await run(message, context, session_id))
+            return leader_result.get("data", {}).get("audio_path")
+
+        audio_path, created = await self.audio_cache.get_or_create(cache_key, synthesize)
+        if created:
+            return leader_result
+        if audio_path:
+            return self._cached_result(audio_path, session_id)
+        # The shared synthesis failed or was cancelled; give this request its own attempt
+        return await run(message, context, session_id)
+
+    async def stream_task(
+        self, message: str, context: Dict[str, Any], session_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run the agent and yield progress events as soon as ADK produces them.
+
+        Admission and deadlines work as in ``process_task``. Each yielded item is
+        a dict with an ``event`` name and a JSON-serializable ``data`` payload:
+
+        - ``accepted``: the request got a slot (carries the session_id)
+        - ``text``: a partial chunk of model text
+        - ``message``: a complete model message
+        - ``tool_call_start`` / ``tool_call_end``: a tool invocation and its result
+        - ``audio``: the audio URL, once known
+        - ``audio_chunk``: in chunked mode, each sentence chunk's audio, in order
+        - ``done``: the final response, shaped like ``process_task``'s result
+        - ``error``: the run failed or timed out
+
+        Raises:
+            TaskRejectedError: If the request cannot be admitted. This is raised
+                before the first event, so callers can still answer with an HTTP error.
+        """
+        cache_key = self._audio_cache_key(message, context)
+        cached_path = await asyncio.to_thread(self.audio_cache.get, cache_key) if cache_key else None
+        if cached_path:
+            result = self._cached_result(cached_path, session_id)
+            yield {"event": "accepted", "data": {"session_id": session_id}}
+            yield {"event": "audio", "data": {"audio_url": result["data"]["audio_url"], "audio_path": cached_path}}
+            yield {"event": "done", "data": result}
+            return
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        timeout = float(context.get("timeout") or self.request_timeout)
+        deadline = started + timeout
+
+        async with self._admit(deadline):
+            status = "error"
+            stream = self._stream_chunked if self._chunked(context) else self._stream_agent
+            try:
+                async with aclosing(stream(message, context, session_id, cache_key)) as events:
+                    while True:
+                        # The deadline covers each step rather than the whole loop: the
+                        # caller may pull events from different tasks (sse-starlette
+                        # does), and a timeout is bound to the task that entered it
+                        async with asyncio.timeout_at(deadline):
+                            try:
+                                item = await anext(events)
+                            except StopAsyncIteration:
+                                break
+                        if item["event"] == "done":
+                            status = "success"
+                        yield item
+            except TimeoutError:
+                status = "timed_out"
+                self._counters["timed_out"] += 1
+                yield {"event": "error", "data": {"message": f"Timed out after {timeout:g}s", "error_type": "TimeoutError"}}
+            except asyncio.CancelledError:
+                status = "cancelled"
+                self._counters["cancelled"] += 1
+                raise
+            except Exception as e:
+                logger.error(f"Error streaming agent run: {str(e)}")
+                yield {"event": "error", "data": {"message": f"Error processing your request: {str(e)}", "error_type": type(e).__name__}}
+            finally:
+                outcome = {"success": "completed", "error": "failed"}.get(status, status)
+                if status == "success":
+                    self._latencies.append(loop.time() - started)
+                    self._counters["completed"] += 1
+                elif status == "error":
+                    self._counters["failed"] += 1
+                request_duration.record(loop.time() - started, {"mode": "stream", "outcome": outcome})
+                request_outcomes.add(1, {"outcome": outcome})
+
+    async def _stream_agent(
+        self, message: str, context: Dict[str, Any], session_id: Optional[str], cache_key: Optional[str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield ``stream_task`` events for one agent turn."""
+        user_id, session_id = await self._ensure_session(context, session_id)
+        yield {"event": "accepted", "data": {"session_id": session_id}}
+
+        request_content = adk_types.Content(role="user", parts=[adk_types.Part(text=message)])
+        final_message = "(No response generated)"
+        audio: Dict[str, Any] = {"audio_url": None, "audio_path": None, "voice_id": None}
+        async for event in self.runner.run_async(
+            user_id=user_id,
+            session_id=session_id,
+            new_message=request_content,
+            run_config=RunConfig(streaming_mode=StreamingMode.SSE),
+        ):
+            for call in event.get_function_calls():
+                yield {
+                    "event": "tool_call_start",
+                    "data": {"id": call.id, "name": call.name, "args": to_jsonable_python(call.args, fallback=str)},
+                }
+            for response in event.get_function_responses():
+                yield {
+                    "event": "tool_call_end",
+                    "data": {"id": response.id, "name": response.name, "response": to_jsonable_python(response.response, fallback=str)},
+                }
+            if await self._track_synthesis(event, user_id, session_id, audio):
+                yield {"event": "audio", "data": dict(audio)}
+
+            if not (event.content and event.content.role == "model" and event.content.parts):
+                continue
+            text = "".join(part.text for part in event.content.parts if part.text)
+            if not text:
+                continue
+            if event.partial:
+                yield {"event": "text", "data": {"text": text}}
+                continue
+
+            yield {"event": "message", "data": {"text": text}}
+            if event.is_final_response():
+                final_message = text
+
+        if cache_key and audio["audio_path"]:
+            await asyncio.to_thread(self.audio_cache.put, cache_key, audio["audio_path"])
+        yield {
+            "event": "done",
+            "data": {
+                "message": final_message,
+                "status": "success",
+                "data": audio,
+                "session_id": session_id,
+            },
+        }
+
+    async def _stream_chunked(
+        self, message: str, context: Dict[str, Any], session_id: Optional[str], cache_key: Optional[str]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield ``stream_task`` events for a chunked synthesis: one ``audio_chunk`` per segment, in order."""
+        chunks = self._chunks(message)
+        yield {"event": "accepted", "data": {"session_id": session_id, "chunks": len(chunks)}}
+
+        segments = []
+        async for segment in self._iter_chunk_audio(chunks, context):
+            segments.append(segment)
+            yield {"event": "audio_chunk", "data": segment}
+
+        audio = await self._combine_segments(segments, context)
+        if cache_key and audio["audio_path"]:
+            await asyncio.to_thread(self.audio_cache.put, cache_key, audio["audio_path"])
+        yield {"event": "audio", "data": {k: v for k, v in audio.items() if k != "segments"}}
+        yield {
+            "event": "done",
+            "data": {
+                "message": f"I've converted your text to speech in {len(segments)} segments.",
+                "status": "success",
+                "data": audio,
+                "session_id": session_id,
+            },
+        }
+
+    def _chunked(self, context: Dict[str, Any]) -> bool:
+        return bool(context.get("chunked", CHUNKED_TTS))
+
+    @staticmethod
+    def _chunks(message: str) -> List[str]:
+        chunks = chunk_text(message, CHUNK_MAX_CHARS)
+        if not chunks:
+            raise ValueError("No text to synthesize")
+        return chunks
+
+    async def _run_chunked(self, message: str, context: Dict[str, Any], session_id: Optional[str]) -> Dict[str, Any]:
+        """Synthesize ``message`` chunk by chunk and return one response for the combined audio."""
+        try:
+            chunks = self._chunks(message)
+            segments = [segment async for segment in self._iter_chunk_audio(chunks, context)]
+            audio = await self._combine_segments(segments, context)
+        except Exception as e:
+            logger.error(f"Error in chunked synthesis: {str(e)}")
+            return {
+                "message": f"Error processing your request: {str(e)}",
+                "status": "error",
+                "data": {"error_type": type(e).__name__},
+            }
+        return {
+            "message": f"I've converted your text to speech. The audio file is saved at `{audio['audio_path']}`",
+            "status": "success",
+            "data": audio,
+            "session_id": session_id,
+        }
+
+    async def _iter_chunk_audio(self, chunks: List[str], context: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Synthesize ``chunks`` concurrently and yield their segments in reading order.
+
+        At most CHUNK_CONCURRENCY chunks are synthesized at once, in order, so
+        the first segment is ready after roughly one chunk's synthesis time.
+        Each chunk has its own audio cache entry, so a retry or a summary that
+        shares sentences with an earlier one only synthesizes what is new.
+        """
+        voice = self._synthesis_voice(context)
+        limit = asyncio.Semaphore(max(1, CHUNK_CONCURRENCY))
+        # A lone chunk is the whole message, whose cache entry the caller manages;
+        # _run_shared holds its in-flight entry, so looking it up here would wait on itself
+        use_cache = len(chunks) > 1
+
+        async def synthesize(text: str) -> tuple[str, bool]:
+            async with limit:
+                key = self._audio_cache_key(text, context) if use_cache else None
+                if key is None:
+                    return await self._synthesize_chunk(text, voice), False
+                path, created = await self.audio_cache.get_or_create(key, lambda: self._synthesize_chunk(text, voice))
+                if path:
+                    return path, not created
+                if created:
+                    raise RuntimeError(f"TTS produced no audio for chunk: {text[:60]!r}")
+                # Another request's synthesis of this chunk failed or was cancelled
+                return await self._synthesize_chunk(text, voice), False
+
+        tasks = [asyncio.create_task(synthesize(chunk)) for chunk in chunks]
+        try:
+            for index, (text, task) in enumerate(zip(chunks, tasks)):
+                path, cached = await task
+                yield {"index": index, "text": text, "audio_url": f"file://{path}", "audio_path": path, "cached": cached}
+        finally:
+            # Stop the remaining chunks if the caller went away or a chunk failed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _synthesize_chunk(self, text: str, voice: str) -> str:
+        """Call the agent's TTS tool for one chunk, retrying once, and return the audio path."""
+        tool = await self._get_tts_tool()
+        for attempt in range(CHUNK_RETRIES + 1):
+            try:
+                with tracer.start_as_current_span("speaker.tts_chunk") as span:
+                    span.set_attribute("speaker.chunk_chars", len(text))
+                    response = await tool.run_async(args={"text": text, "voice_name": voice}, tool_context=None)
+                audio_path = _audio_path_from_response(response)
+                if not audio_path:
+                    raise RuntimeError(f"{tool.name} returned no audio file: {str(response)[:200]}")
+                self._counters["tts_syntheses"] += 1
+                return audio_path
+            except Exception as e:
+                if attempt == CHUNK_RETRIES:
+                    raise
+                logger.warning(f"Retrying TTS chunk after error: {e}")
+
+    async def _get_tts_tool(self):
+        """Find the agent's TTS tool (any of SPEAKER_TTS_TOOLS) so chunks can skip the LLM."""
+        if self._tts_tool is None:
+            for tool in await self.agent.canonical_tools():
+                if tool.name in TTS_TOOL_NAMES:
+                    self._tts_tool = tool
+                    break
+            else:
+                raise RuntimeError(f"Agent {self.agent.name} has no TTS tool named {sorted(TTS_TOOL_NAMES)}")
+        return self._tts_tool
+
+    async def _combine_segments(self, segments: List[Dict[str, Any]], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Join segment files into one response payload; segments are concatenated when they are all MP3."""
+        paths = [segment["audio_path"] for segment in segments]
+        audio_path = paths[0] if len(paths) == 1 else None
+        if len(paths) > 1 and all(path.lower().endswith(".mp3") for path in paths):
+            audio_path = os.path.join(self.output_dir, f"chunked_{uuid.uuid4().hex}.mp3")
+            await asyncio.to_thread(_concat_files, paths, audio_path)
+        return {
+            "audio_url": f"file://{audio_path}" if audio_path else None,
+            "audio_path": audio_path,
+            "voice_id": self._synthesis_voice(context),
+            "segments": [{k: segment[k] for k in ("index", "audio_url", "audio_path", "cached")} for segment in segments],
+        }
+
+    async def _track_synthesis(self, event, user_id: str, session_id: str, audio: Dict[str, Any]) -> bool:
         """
+        Record the voice and audio file produced by TTS tool calls in ``event``.
+
+        The path is taken from the TTS tool's function response or, for tools
+        that store audio as an artifact, from the artifact service. ``audio``
+        holds ``audio_path``/``audio_url``/``voice_id`` and is updated in place.
+
+        Returns:
+            True if the event produced a new audio file.
+        """
+        for call in event.get_function_calls():
+            if call.name in TTS_TOOL_NAMES and call.args:
+                audio["voice_id"] = call.args.get("voice_name") or call.args.get("voice_id") or audio.get("voice_id")
+
+        audio_path = None
+        for response in event.get_function_responses():
+            if response.name in TTS_TOOL_NAMES:
+                audio_path = _audio_path_from_response(response.response) or audio_path
+
+        artifact_delta = event.actions.artifact_delta if event.actions else None
+        for filename, version in (artifact_delta or {}).items():
+            if audio_path or not filename.lower().endswith(AUDIO_EXTENSIONS):
+                continue
+            part = await self.artifact_service.load_artifact(
+                app_name=A2A_APP_NAME, user_id=user_id, session_id=session_id, filename=filename, version=version
+            )
+            if part and part.inline_data and part.inline_data.data:
+                audio_path = os.path.join(self.output_dir, f"{session_id}_v{version}_{os.path.basename(filename)}")
+                await asyncio.to_thread(_write_bytes, audio_path, part.inline_data.data)
+
+        if not audio_path or audio_path == audio.get("audio_path"):
+            return False
+        audio["audio_path"] = audio_path
+        audio["audio_url"] = f"file://{audio_path}"
+        self._counters["tts_syntheses"] += 1
+        logger.info(f"Captured audio path from {event.author}: {audio_path}")
+        return True
+
+    async def _ensure_session(self, context: Dict[str, Any], session_id: Optional[str]) -> tuple[str, str]:
+        """Return ``(user_id, session_id)``, creating the session if it does not exist."""
         # Get user_id from context or use default
-        user_id = context.get("user_id", "default_a2a_user")
+        user_id = context.get("user_id", DEFAULT_USER_ID)
         
-        # Create or get session
+        # Create or get session; a pre-created spare skips the create below
+        if not session_id and user_id == DEFAULT_USER_ID:
+            session_id = self._take_spare_session()
         if not session_id:
             session_id = str(uuid.uuid4())
             logger.info(f"Generated new session_id: {session_id}")
             
-        session = self.session_service.get_session(app_name=A2A_APP_NAME, user_id=user_id, session_id=session_id)
+        with tracer.start_as_current_span("speaker.session.get"):
+            session = await self.session_service.get_session(app_name=A2A_APP_NAME, user_id=user_id, session_id=session_id)
         if not session:
-            session = self.session_service.create_session(app_name=A2A_APP_NAME, user_id=user_id, session_id=session_id, state={})
+            with tracer.start_as_current_span("speaker.session.create"):
+                session = await self.session_service.create_session(app_name=A2A_APP_NAME, user_id=user_id, session_id=session_id, state={})
             logger.info(f"Created new session: {session_id}")
-        
+        return user_id, session_id
+
+    async def _run_task(self, message: str, context: Dict[str, Any], session_id: Optional[str]) -> Dict[str, Any]:
+        """Run one agent turn and format the response."""
+        user_id, session_id = await self._ensure_session(context, session_id)
+
         # Create user message
         request_content = adk_types.Content(role="user", parts=[adk_types.Part(text=message)])
         
@@ -85,37 +798,36 @@ class TaskManager:
             
             # Process response
             final_message = "(No response generated)"
-            audio_url = None
-            raw_events = []
+            audio: Dict[str, Any] = {"audio_url": None, "audio_path": None, "voice_id": None}
+            # Keep only the trailing events as objects; they are serialized
+            # once, when the response is built, instead of on every event
+            echo_events = context.get("echo_events", True) and DEFAULT_EVENT_ECHO_SIZE > 0
+            recent_events: Optional[deque] = deque(maxlen=DEFAULT_EVENT_ECHO_SIZE) if echo_events else None
 
             # Process events
             async for event in events_async:
-                raw_events.append(event.model_dump(exclude_none=True))
-                
-                # Only extract from the final response
+                if recent_events is not None:
+                    recent_events.append(event)
+
+                # The audio file comes from the TTS tool's response, not the model's wording
+                await self._track_synthesis(event, user_id, session_id, audio)
+
+                # Only take the message text from the final response
                 if event.is_final_response() and event.content and event.content.role == "model":
                     if event.content.parts and event.content.parts[0].text:
                         final_message = event.content.parts[0].text
                         logger.info(f"Final response: {final_message}")
-                        
-                        # Extract audio path from backticks
-                        if "`" in final_message:
-                            parts = final_message.split("`")
-                            if len(parts) >= 3:
-                                path_text = parts[1]
-                                
-                                if path_text.startswith("/") and ".mp3" in path_text:
-                                    audio_url = f"file://{path_text}"
-                                    logger.info(f"Extracted audio path: {audio_url}")
             
             # Return formatted response
+            data: Dict[str, Any] = dict(audio)
+            if recent_events is not None:
+                with tracer.start_as_current_span("speaker.serialize_events"):
+                    data["raw_events"] = [event.model_dump(exclude_none=True) for event in recent_events]
             return {
                 "message": final_message, 
                 "status": "success",
-                "data": {
-                    "audio_url": audio_url,
-                    "raw_events": raw_events[-3:]
-                }
+                "data": data,
+                "session_id": session_id,
             }
 
         except Exception as e:
@@ -0,0 +1,175 @@
+"""
+Background warmup for the Speaker Agent's A2A server.
+Lets the server bind and answer probes while the ADK stack is imported, the
+agent and TaskManager are built and the TTS MCP server is started.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import aclosing, contextmanager
+from typing import Any, AsyncIterator, Dict, Optional
+
+from opentelemetry import trace
+
+from common.a2a_server import TaskRejectedError
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# Start the TTS MCP server during warmup instead of on the first request
+WARMUP_MCP = os.getenv("SPEAKER_WARMUP_MCP", "true").lower() == "true"
+# Empty sessions created ahead of time for requests that carry no session_id
+PREWARM_SESSIONS = int(os.getenv("SPEAKER_PREWARM_SESSIONS", "0"))
+# How long a request that arrives mid-warmup waits for it before getting a 503
+WARMUP_WAIT = float(os.getenv("SPEAKER_WARMUP_WAIT", "30"))
+
+
+class WarmingTaskManager:
+    """Stands in for the speaker's TaskManager until warmup has built it.
+
+    Implements the task-manager interface of ``create_agent_server`` plus
+    ``get_readiness()``. The state moves from ``starting`` to ``warming`` to
+    ``ready`` (or ``failed``). Requests that arrive while warming wait up to
+    ``wait_timeout`` seconds and are then rejected with a 503. After a failed
+    warmup, every request is rejected.
+    """
+
+    def __init__(
+        self,
+        warm_mcp: bool = WARMUP_MCP,
+        prewarm_sessions: int = PREWARM_SESSIONS,
+        wait_timeout: float = WARMUP_WAIT,
+    ):
+        self.warm_mcp = warm_mcp
+        self.prewarm_sessions = prewarm_sessions
+        self.wait_timeout = wait_timeout
+        self.state = "starting"
+        self.error: Optional[str] = None
+        self.task_manager = None
+        self._timings: Dict[str, float] = {}
+        self._created_at = time.perf_counter()
+        self._ready_at: Optional[float] = None
+        self._done = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._mcp_pool = None
+
+    def start(self) -> asyncio.Task:
+        """Start warming up in the background; safe to call more than once."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._warm())
+        return self._task
+
+    async def aclose(self) -> None:
+        """Stop an unfinished warmup and the MCP servers it may have started."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._mcp_pool is not None:
+            await self._mcp_pool.close()
+
+    @contextmanager
+    def _step(self, name: str):
+        started = time.perf_counter()
+        with tracer.start_as_current_span(f"speaker.warmup.{name}"):
+            try:
+                yield
+            finally:
+                self._timings[name] = round(time.perf_counter() - started, 3)
+
+    @staticmethod
+    def _import_task_manager():
+        from .task_manager import TaskManager
+
+        return TaskManager
+
+    @staticmethod
+    def _import_agent():
+        from .agent import root_agent
+
+        return root_agent
+
+    async def _warm(self) -> None:
+        self.state = "warming"
+        try:
+            # Imports and agent construction run off the event loop so
+            # health and readiness probes are answered in the meantime
+            with self._step("imports"):
+                task_manager_cls = await asyncio.to_thread(self._import_task_manager)
+            with self._step("agent"):
+                agent = await asyncio.to_thread(self._import_agent)
+
+            from common.mcp_pool import get_mcp_pool
+
+            self._mcp_pool = get_mcp_pool()
+            self._mcp_pool.start_health_checks()
+
+            with self._step("task_manager"):
+                task_manager = task_manager_cls(agent=agent)
+            if self.warm_mcp:
+                with self._step("mcp"):
+                    try:
+                        # Listing the agent's tools starts its pooled MCP servers
+                        await agent.canonical_tools()
+                    except Exception as e:
+                        # The pool retries on first use, so this does not block readiness
+                        logger.warning(f"MCP warmup failed, servers will start on first use: {e}")
+            if self.prewarm_sessions > 0:
+                with self._step("sessions"):
+                    await task_manager.prewarm_sessions(self.prewarm_sessions)
+
+            self.task_manager = task_manager
+            self.state = "ready"
+            self._ready_at = time.perf_counter()
+            logger.info(f"Speaker ready in {self._ready_at - self._created_at:.2f}s: {self._timings}")
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            logger.error(f"Speaker warmup failed: {e}", exc_info=True)
+        finally:
+            self._done.set()
+
+    async def _ready_task_manager(self):
+        """Return the TaskManager, waiting for warmup if needed.
+
+        Raises:
+            TaskRejectedError: 503 if warmup failed or did not finish in time.
+        """
+        if self.task_manager is not None:
+            return self.task_manager
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout=self.wait_timeout)
+        except asyncio.TimeoutError:
+            raise TaskRejectedError(503, "Speaker is still warming up, please retry shortly.", retry_after=2)
+        if self.task_manager is None:
+            raise TaskRejectedError(503, f"Speaker failed to start: {self.error}")
+        return self.task_manager
+
+    def get_readiness(self) -> Dict[str, Any]:
+        """Return the warmup state, any error, and how long each step took."""
+        return {
+            "state": self.state,
+            "error": self.error,
+            "steps": dict(self._timings),
+            "ready_after_s": round(self._ready_at - self._created_at, 3) if self._ready_at else None,
+        }
+
+    async def process_task(self, message: str, context: Dict[str, Any], session_id: Optional[str] = None) -> Dict[str, Any]:
+        task_manager = await self._ready_task_manager()
+        return await task_manager.process_task(message=message, context=context, session_id=session_id)
+
+    async def stream_task(
+        self, message: str, context: Dict[str, Any], session_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        task_manager = await self._ready_task_manager()
+        async with aclosing(task_manager.stream_task(message=message, context=context, session_id=session_id)) as events:
+            async for event in events:
+                yield event
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = self.task_manager.get_stats() if self.task_manager is not None else {}
+        return {**stats, "startup": self.get_readiness()}
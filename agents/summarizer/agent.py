@@ -1,5 +1,39 @@
+from google.adk.agents import Agent
+from google.adk.models.lite_llm import LiteLlm
 from dotenv import load_dotenv
 import os
 
 # Load environment variables (for GOOGLE_API_KEY)
 load_dotenv(dotenv_path=os.path.join(os.path.dirname(__file__), "..", "..", ".env"))
+
+# Imported after .env is loaded; the cache reads its settings at import time
+from .response_cache import get_summary_cache
+
+SUMMARIZER_MODEL = os.getenv("SUMMARIZER_MODEL", "gemini/gemini-1.5-pro-latest")
+
+
+def create_summarizer_agent():
+    """Build a new newscaster summarizer; each caller gets its own instance so it can be parented freely."""
+    llm = LiteLlm(model=SUMMARIZER_MODEL, api_key=os.environ.get("GOOGLE_API_KEY"))
+    # Repeated and overlapping headline lists are answered from the shared response cache
+    cache = get_summary_cache()
+    summarizer = Agent(
+        name="newscaster_summarizer_agent",
+        description="Summarizes a list of Reddit post titles in a newscaster style.",
+        model=llm,
+        instruction=(
+            "You are a news anchor summarizing Reddit headlines. "
+            "Given a list of post titles, provide a concise, engaging summary in a professional newscaster style. "
+            "Highlight key themes or interesting points found only in the titles. "
+            "Start with an anchor intro like 'Here are today's top stories from the subreddit...' or similar. Keep it brief. "
+            "Refer to subreddits by name, no need to mention 'r/'. "
+            "After the intro, cover each headline in one self-contained sentence on its own line starting with '- ', "
+            "in the order given."
+        ),
+        before_model_callback=cache.before_model if cache else None,
+        after_model_callback=cache.after_model if cache else None,
+    )
+    return summarizer
+
+
+root_agent = create_summarizer_agent()
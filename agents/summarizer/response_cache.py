@@ -0,0 +1,333 @@
+"""
+Response cache for the newscaster summarizer.
+Serves repeated or overlapping headline lists from SQLite instead of calling the model.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+from opentelemetry import trace
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+SUMMARY_CACHE_ENABLED = os.getenv("SUMMARY_CACHE_ENABLED", "true").lower() == "true"
+# SQLite file, or ":memory:" for a per-process cache
+SUMMARY_CACHE_DB = os.getenv("SUMMARY_CACHE_DB", os.path.join(tempfile.gettempdir(), "summarizer_cache.db"))
+SUMMARY_CACHE_TTL = float(os.getenv("SUMMARY_CACHE_TTL", str(24 * 3600)))
+SUMMARY_CACHE_MAX_ENTRIES = int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "5000"))
+# Share of headlines that must already have a cached line before only the rest are sent to the model
+SUMMARY_CACHE_MIN_REUSE = float(os.getenv("SUMMARY_CACHE_MIN_REUSE", "0.5"))
+
+# Headline lines in the request and per-headline lines in the summary
+BULLET = re.compile(r"^(?:[-*•]|\d+[.)])\s+(.+)$")
+
+# Requests whose fragment-tier state is kept between the before/after callbacks
+MAX_PENDING = 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    tier TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (tier, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_by_access ON entries (tier, last_access);
+"""
+
+
+def _normalize(text: str) -> str:
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+
+def _hash(*parts: object) -> str:
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _split_bullets(text: str) -> Tuple[List[str], List[str], List[str]]:
+    """
+    Split text into the lines before its first bullet, the contents of its
+    bullet lines and the lines after its last bullet.
+
+    A non-bullet line between two bullets continues the bullet above it.
+    """
+    head: List[str] = []
+    bullets: List[str] = []
+    tail: List[str] = []
+    for line in text.splitlines():
+        line = _normalize(line)
+        if not line:
+            continue
+        match = BULLET.match(line)
+        if match:
+            if tail:
+                bullets[-1] = " ".join([bullets[-1], *tail])
+                tail = []
+            bullets.append(match.group(1))
+        else:
+            (tail if bullets else head).append(line)
+    return head, bullets, tail
+
+
+def _render(head: List[str], lines: List[str], tail: List[str]) -> str:
+    return "\n".join([*head, *(f"- {line}" for line in lines), *tail])
+
+
+def _text_response(text: str) -> LlmResponse:
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=text)]))
+
+
+class SummaryCache:
+    """Two-tier summarizer cache, installed as the agent's model callbacks.
+
+    Only single-turn requests are cached, i.e. one user message holding a
+    context line such as ``Subreddit: hvac`` followed by ``- title`` lines.
+    That is what the digest pipeline sends. Multi-turn requests (e.g. the
+    summarizer running as a coordinator sub-agent) always reach the model.
+
+    - Exact tier: keyed by the model, the system instruction, the context
+      lines and the normalized titles in order (the summary follows their
+      order). A hit skips the model.
+    - Fragment tier: the summary's intro (the lines before and after its
+      headline lines) and each per-headline line are stored separately. When at least ``min_reuse`` of the headlines
+      already have a cached line, only the remaining headlines are sent to
+      the model. The response is then spliced back in the original order,
+      under the cached intro if there is one. Only a summary of the full
+      list stores an intro, since a narrowed request's intro covers just
+      the headlines sent. If every headline and the intro are cached, the
+      model is skipped.
+
+    A lookup reads every entry it may need with one query in one
+    transaction, since it runs on the event loop.
+
+    Entries expire ``ttl`` seconds after they are written. Beyond
+    ``max_entries`` per tier, the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str = SUMMARY_CACHE_DB,
+        ttl: float = SUMMARY_CACHE_TTL,
+        max_entries: int = SUMMARY_CACHE_MAX_ENTRIES,
+        min_reuse: float = SUMMARY_CACHE_MIN_REUSE,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.min_reuse = min_reuse
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        # invocation_id -> what after_model needs to store or splice the response
+        self._pending: "OrderedDict[str, Dict]" = OrderedDict()
+        self._stats = {"exact_hits": 0, "fragment_hits": 0, "partial_hits": 0, "misses": 0, "uncacheable": 0, "evictions": 0}
+
+    def before_model(self, callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+        """Answer from the cache, or narrow the request to the headlines without a cached line."""
+        with tracer.start_as_current_span("summarizer.cache.lookup") as span:
+            request = self._parse_request(llm_request)
+            if request is None:
+                self._count("uncacheable")
+                span.set_attribute("cache.result", "uncacheable")
+                return None
+            scope, context, titles = request
+
+            exact_key = _hash(scope, context, [title.casefold() for title in titles])
+            intro_key = _hash(scope, context)
+            fragment_keys = [_hash(scope, title.casefold()) for title in titles]
+            found = self._get_many([("exact", exact_key), ("intro", intro_key), *(("fragment", key) for key in fragment_keys)])
+            cached = found.get(("exact", exact_key))
+            if cached is not None:
+                self._count("exact_hits")
+                span.set_attribute("cache.result", "exact")
+                return _text_response(cached)
+
+            fragments = [found.get(("fragment", key)) for key in fragment_keys]
+            reused = sum(fragment is not None for fragment in fragments)
+            partial = reused / len(titles) >= self.min_reuse
+            intro = found.get(("intro", intro_key)) if partial else None
+            if intro is not None and reused == len(titles):
+                head, tail = json.loads(intro)
+                text = _render(head, fragments, tail)
+                self._put([("exact", exact_key, text)])
+                self._count("fragment_hits")
+                span.set_attribute("cache.result", "fragments")
+                return _text_response(text)
+
+            pending = {
+                "exact_key": exact_key,
+                "intro_key": intro_key,
+                "fragment_keys": fragment_keys,
+                "fragments": None,
+                "intro": None,
+            }
+            if partial and reused < len(titles):
+                # Only the headlines without a cached line go to the model
+                missing = [title for title, fragment in zip(titles, fragments) if fragment is None]
+                llm_request.contents = [
+                    types.Content(role="user", parts=[types.Part(text=_render(context[0], missing, context[1]))])
+                ]
+                pending["fragments"] = fragments
+                pending["intro"] = json.loads(intro) if intro is not None else None
+                self._count("partial_hits")
+                span.set_attribute("cache.result", "partial")
+                span.set_attribute("cache.reused_titles", reused)
+            else:
+                self._count("misses")
+                span.set_attribute("cache.result", "miss")
+            self._remember(callback_context.invocation_id, pending)
+            return None
+
+    def after_model(self, callback_context: CallbackContext, llm_response: LlmResponse) -> Optional[LlmResponse]:
+        """Store the model's summary and, for a narrowed request, splice in the cached lines."""
+        if llm_response.partial or llm_response.error_code:
+            return None
+        with self._lock:
+            pending = self._pending.pop(callback_context.invocation_id, None)
+        if pending is None or not llm_response.content or not llm_response.content.parts:
+            return None
+        text = "".join(part.text or "" for part in llm_response.content.parts).strip()
+        if not text:
+            return None
+
+        head, lines, tail = _split_bullets(text)
+        cached = pending["fragments"]
+        missing_keys = [key for key, fragment in zip(pending["fragment_keys"], cached or [None] * len(pending["fragment_keys"])) if fragment is None]
+        if len(lines) != len(missing_keys):
+            # The model did not answer one line per headline; keep its text but don't split it up
+            if cached is None:
+                self._put([("exact", pending["exact_key"], text)])
+                return None
+            return _text_response(_render(head, [*lines, *(fragment for fragment in cached if fragment is not None)], tail))
+
+        rows = [("fragment", key, line) for key, line in zip(missing_keys, lines)]
+        if cached is None:
+            rows += [("exact", pending["exact_key"], text), ("intro", pending["intro_key"], json.dumps([head, tail]))]
+            self._put(rows)
+            return None
+
+        # The model only saw the missing headlines, so its intro is not one for the full list
+        new_lines = iter(lines)
+        merged = [fragment if fragment is not None else next(new_lines) for fragment in cached]
+        if pending["intro"] is not None:
+            head, tail = pending["intro"]
+        full_text = _render(head, merged, tail)
+        if pending["intro"] is not None:
+            rows.append(("exact", pending["exact_key"], full_text))
+        self._put(rows)
+        return _text_response(full_text)
+
+    def stats(self) -> Dict[str, object]:
+        """Return hit/miss counters and the number of stored entries per tier."""
+        with self._lock:
+            sizes = dict(self._conn.execute("SELECT tier, COUNT(*) FROM entries GROUP BY tier"))
+            stats: Dict[str, object] = {**self._stats, "entries": sizes}
+        lookups = sum(self._stats[k] for k in ("exact_hits", "fragment_hits", "partial_hits", "misses"))
+        stats["model_calls_skipped_ratio"] = round((self._stats["exact_hits"] + self._stats["fragment_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM entries")
+
+    @staticmethod
+    def _parse_request(llm_request: LlmRequest) -> Optional[Tuple[list, Tuple[List[str], List[str]], List[str]]]:
+        """Return ``(scope, (lines before, lines after the titles), titles)`` for a cacheable request, else None."""
+        if len(llm_request.contents) != 1 or llm_request.contents[0].role != "user":
+            return None
+        parts = llm_request.contents[0].parts or []
+        if any(part.text is None for part in parts):
+            return None
+        head, titles, tail = _split_bullets("".join(part.text for part in parts))
+        if not titles:
+            return None
+        instruction = llm_request.config.system_instruction if llm_request.config else None
+        scope = [llm_request.model, str(instruction or "")]
+        # Drop repeated headlines, keeping the first spelling and the original order
+        unique: Dict[str, str] = {}
+        for title in titles:
+            unique.setdefault(title.casefold(), title)
+        return scope, (head, tail), list(unique.values())
+
+    def _remember(self, invocation_id: str, pending: Dict) -> None:
+        with self._lock:
+            self._pending[invocation_id] = pending
+            # Model calls that failed never reach after_model; don't let their state pile up
+            while len(self._pending) > MAX_PENDING:
+                self._pending.popitem(last=False)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def _get_many(self, entries: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+        """Return the unexpired values of ``(tier, key)`` entries, marking them used."""
+        now = time.time()
+        wanted = set(entries)
+        keys = sorted({key for _, key in wanted})
+        with self._lock, self._conn:
+            rows = self._conn.execute(
+                f"SELECT tier, key, value, created FROM entries WHERE key IN ({', '.join('?' * len(keys))})", keys
+            ).fetchall()
+            found: Dict[Tuple[str, str], str] = {}
+            expired: List[Tuple[str, str]] = []
+            for tier, key, value, created in rows:
+                if (tier, key) not in wanted:
+                    continue
+                if now - created > self.ttl:
+                    expired.append((tier, key))
+                else:
+                    found[(tier, key)] = value
+            self._conn.executemany("DELETE FROM entries WHERE tier = ? AND key = ?", expired)
+            self._conn.executemany("UPDATE entries SET last_access = ? WHERE tier = ? AND key = ?", [(now, *entry) for entry in found])
+        return found
+
+    def _put(self, rows: List[Tuple[str, str, str]]) -> None:
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                [(tier, key, value, now, now) for tier, key, value in rows],
+            )
+            for tier in {row[0] for row in rows}:
+                cursor = self._conn.execute(
+                    """
+                    DELETE FROM entries WHERE tier = ? AND key IN (
+                        SELECT key FROM entries WHERE tier = ? ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (tier, tier, self.max_entries),
+                )
+                self._stats["evictions"] += max(0, cursor.rowcount)
+
+
+_cache: Optional[SummaryCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_summary_cache() -> Optional[SummaryCache]:
+    """Return the process-wide summarizer cache, or None if SUMMARY_CACHE_ENABLED is false."""
+    global _cache
+    if not SUMMARY_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = SummaryCache()
+        return _cache
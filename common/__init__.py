@@ -0,0 +1 @@
+# Shared helpers used by the agent entry points (A2A server, etc.).
@@ -0,0 +1,214 @@
+"""
+Helper for serving an agent as a standalone A2A service.
+Provides the request/response models and a FastAPI app factory shared by agent entry points.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from opentelemetry import trace
+from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
+
+logger = logging.getLogger(__name__)
+tracer = trace.get_tracer(__name__)
+
+# How often a running request checks whether its client went away
+DISCONNECT_POLL_SECONDS = 0.5
+
+
+class AgentRequest(BaseModel):
+    message: str = Field(..., description="The message to process")
+    context: Dict[str, Any] = Field(default_factory=dict, description="Additional context data")
+    session_id: Optional[str] = Field(None, description="Session identifier for conversation continuity")
+
+
+class AgentResponse(BaseModel):
+    message: str = Field(..., description="The response message")
+    status: str = Field(default="success", description="Status of the response")
+    data: Dict[str, Any] = Field(default_factory=dict, description="Additional response data")
+    session_id: Optional[str] = Field(None, description="Session identifier")
+
+
+class TaskRejectedError(Exception):
+    """Raised by a task manager to refuse a request with a specific HTTP status.
+
+    Used for backpressure: 429 when the admission queue is full, 503 when a
+    request could not be scheduled before its deadline.
+    """
+
+    def __init__(self, status_code: int, message: str, retry_after: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.message = message
+        self.retry_after = retry_after
+
+
+async def _run_until_disconnect(request: Request, task: asyncio.Task) -> bool:
+    """Wait for ``task``, cancelling it if the client disconnects. Returns False on disconnect."""
+    while True:
+        done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_SECONDS)
+        if done:
+            return True
+        if await request.is_disconnected():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+            return False
+
+
+def _rejection_response(error: TaskRejectedError) -> JSONResponse:
+    headers = {"Retry-After": str(error.retry_after)} if error.retry_after else None
+    return JSONResponse(
+        status_code=error.status_code,
+        content=AgentResponse(message=error.message, status="rejected").model_dump(),
+        headers=headers,
+    )
+
+
+def create_agent_server(
+    name: str,
+    description: str,
+    task_manager: Any,
+    metrics_renderer: Optional[Callable[[], str]] = None,
+) -> FastAPI:
+    """
+    Create a FastAPI app exposing an agent over the A2A protocol.
+
+    Args:
+        name: Agent name, used for the app title and metadata.
+        description: Agent description.
+        task_manager: Object with an async ``process_task(message, context, session_id)``
+            method. If it also has ``get_stats()``, a ``/stats`` endpoint is added;
+            if it has an async-generator ``stream_task(...)``, a ``/run/stream``
+            Server-Sent Events endpoint is added; if it has ``get_readiness()``
+            returning a dict with a ``state`` key, a ``/ready`` endpoint
+            answers 200 once the state is ``ready`` and 503 before that.
+        metrics_renderer: Optional callable returning Prometheus text; when
+            given, it is served at ``/metrics``.
+
+    Returns:
+        The configured FastAPI application.
+    """
+    app = FastAPI(title=f"{name} Agent", description=description)
+    endpoints = ["run", "health"]
+    if hasattr(task_manager, "stream_task"):
+        endpoints.append("run/stream")
+    if hasattr(task_manager, "get_stats"):
+        endpoints.append("stats")
+    if hasattr(task_manager, "get_readiness"):
+        endpoints.append("ready")
+    if metrics_renderer is not None:
+        endpoints.append("metrics")
+
+    @app.post("/run", response_model=AgentResponse)
+    async def run(agent_request: AgentRequest, request: Request):
+        task = asyncio.create_task(
+            task_manager.process_task(
+                message=agent_request.message,
+                context=agent_request.context,
+                session_id=agent_request.session_id,
+            )
+        )
+        try:
+            completed = await _run_until_disconnect(request, task)
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        if not completed:
+            logger.info("Client disconnected; cancelled in-flight task")
+            # 499 (client closed request) is only seen in logs; the client is gone
+            return Response(status_code=499)
+
+        try:
+            result = task.result()
+        except TaskRejectedError as e:
+            return _rejection_response(e)
+        except Exception as e:
+            logger.error(f"Unhandled error processing task: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=str(e))
+
+        with tracer.start_as_current_span("a2a.serialize_response"):
+            response = AgentResponse(
+                message=result.get("message", ""),
+                status=result.get("status", "success"),
+                data=result.get("data", {}),
+                session_id=result.get("session_id", agent_request.session_id),
+            )
+            return JSONResponse(content=response.model_dump(mode="json"))
+
+    if "run/stream" in endpoints:
+
+        @app.post("/run/stream")
+        async def run_stream(agent_request: AgentRequest):
+            stream = task_manager.stream_task(
+                message=agent_request.message,
+                context=agent_request.context,
+                session_id=agent_request.session_id,
+            )
+            # Pull the first event before responding so admission failures
+            # still surface as a plain HTTP error instead of an SSE stream
+            try:
+                first = await stream.__anext__()
+            except StopAsyncIteration:
+                first = None
+            except TaskRejectedError as e:
+                return _rejection_response(e)
+            except Exception as e:
+                await stream.aclose()
+                logger.error(f"Unhandled error starting task stream: {e}", exc_info=True)
+                raise HTTPException(status_code=500, detail=str(e))
+
+            async def event_source():
+                # EventSourceResponse cancels this generator when the client
+                # disconnects, which in turn cancels the agent run
+                try:
+                    if first is not None:
+                        yield {"event": first["event"], "data": json.dumps(first["data"])}
+                        async for item in stream:
+                            yield {"event": item["event"], "data": json.dumps(item["data"])}
+                finally:
+                    await stream.aclose()
+
+            return EventSourceResponse(event_source())
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy", "agent": name}
+
+    if "ready" in endpoints:
+
+        @app.get("/ready")
+        async def ready():
+            readiness = task_manager.get_readiness()
+            return JSONResponse(content=readiness, status_code=200 if readiness.get("state") == "ready" else 503)
+
+    @app.get("/.well-known/agent.json")
+    async def agent_card():
+        return {
+            "name": name,
+            "description": description,
+            "endpoints": endpoints,
+            "input_format": "text/plain",
+            "output_format": "application/json",
+        }
+
+    if "stats" in endpoints:
+
+        @app.get("/stats")
+        async def stats():
+            return task_manager.get_stats()
+
+    if "metrics" in endpoints:
+
+        @app.get("/metrics", response_class=PlainTextResponse)
+        async def metrics():
+            return PlainTextResponse(metrics_renderer(), media_type="text/plain; version=0.0.4")
+
+    return app
@@ -0,0 +1,281 @@
+"""
+Process-wide pool of MCP server connections shared by every agent.
+Servers start on first use, are health-checked and restarted, and cap concurrent tool calls.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import anyio
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.base_toolset import BaseToolset, ToolPredicate
+from google.adk.tools.mcp_tool.mcp_session_manager import MCPSessionManager, SseServerParams
+from google.adk.tools.mcp_tool.mcp_tool import MCPTool
+from google.adk.tools.tool_context import ToolContext
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.sse import sse_client
+from mcp.client.stdio import stdio_client
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, Tool as McpBaseTool
+
+logger = logging.getLogger(__name__)
+
+MCP_MAX_CONCURRENT_CALLS = int(os.getenv("MCP_MAX_CONCURRENT_CALLS", "4"))
+MCP_CALL_TIMEOUT = float(os.getenv("MCP_CALL_TIMEOUT", "120"))
+MCP_START_TIMEOUT = float(os.getenv("MCP_START_TIMEOUT", "60"))
+MCP_HEALTH_INTERVAL = float(os.getenv("MCP_HEALTH_INTERVAL", "30"))
+
+# Seconds a health-check ping may take before the server is restarted
+PING_TIMEOUT = 10.0
+
+# Raised by ClientSession when writing a request to a transport that is already
+# gone, i.e. the server never received it and the call is safe to send again
+UNSENT_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError)
+
+ConnectionParams = Union[StdioServerParameters, SseServerParams]
+
+
+class PooledMCPServer:
+    """One MCP server connection, started lazily and shared by all its toolsets.
+
+    The connection lives in a dedicated owner task: MCP transports are anyio
+    task groups, which must be exited by the task that entered them, so
+    start, stop and restart all go through that task regardless of which
+    request first used the server.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connection_params: ConnectionParams,
+        max_concurrent_calls: int = MCP_MAX_CONCURRENT_CALLS,
+        call_timeout: float = MCP_CALL_TIMEOUT,
+        retry_tools: Iterable[str] = (),
+    ):
+        self.name = name
+        self.connection_params = connection_params
+        self.call_timeout = call_timeout
+        # Idempotent tools that may be re-sent when the connection drops after the request went out
+        self.retry_tools = frozenset(retry_tools)
+        self._slots = asyncio.Semaphore(max(1, max_concurrent_calls))
+        self._start_lock = asyncio.Lock()
+        self._session: Optional[ClientSession] = None
+        self._owner: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._tools: Optional[List[McpBaseTool]] = None
+        self._stats = {"starts": 0, "restarts": 0, "calls": 0, "call_errors": 0, "failed_pings": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._session is not None and self._owner is not None and not self._owner.done()
+
+    async def list_tools(self) -> List[McpBaseTool]:
+        """Return the server's tools, starting it if needed. The list is cached after the first call."""
+        if self._tools is None:
+            session = await self._ensure_started()
+            self._tools = (await session.list_tools()).tools
+        return self._tools
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Call a tool, waiting for a free slot.
+
+        If the connection turns out to be gone, the server is restarted and the
+        call is retried once, but only when the request never reached the
+        server, or when the tool is listed in ``retry_tools``. Other tools (e.g.
+        a billed TTS synthesis) may have run already, so that error is raised.
+        """
+        async with self._slots:
+            self._stats["calls"] += 1
+            for attempt in range(2):
+                session = await self._ensure_started()
+                try:
+                    return await session.call_tool(
+                        name, arguments=arguments, read_timeout_seconds=timedelta(seconds=self.call_timeout)
+                    )
+                except (*UNSENT_ERRORS, McpError) as e:
+                    retryable = isinstance(e, UNSENT_ERRORS) or (
+                        e.error.code == CONNECTION_CLOSED and name in self.retry_tools
+                    )
+                    if attempt or not retryable:
+                        self._stats["call_errors"] += 1
+                        raise
+                    logger.warning(f"MCP server '{self.name}' connection lost during '{name}': {e!r}; restarting")
+                    await self.restart()
+                except Exception:
+                    self._stats["call_errors"] += 1
+                    raise
+
+    async def health_check(self) -> bool:
+        """Ping a running server and restart it if it does not answer. Idle servers are left alone."""
+        if self._owner is None:
+            return True
+        try:
+            if not self.running:
+                raise ConnectionError("owner task exited")
+            await asyncio.wait_for(self._session.send_ping(), timeout=PING_TIMEOUT)
+            return True
+        except Exception as e:
+            self._stats["failed_pings"] += 1
+            logger.warning(f"MCP server '{self.name}' failed its health check ({e!r}); restarting")
+            try:
+                await self.restart()
+            except Exception as restart_error:
+                logger.error(f"Could not restart MCP server '{self.name}': {restart_error}")
+            return False
+
+    async def restart(self) -> None:
+        async with self._start_lock:
+            await self._stop_owner()
+            self._stats["restarts"] += 1
+            await self._start()
+
+    async def close(self) -> None:
+        async with self._start_lock:
+            await self._stop_owner()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "running": self.running, "tools": len(self._tools or [])}
+
+    async def _ensure_started(self) -> ClientSession:
+        if self.running:
+            return self._session
+        async with self._start_lock:
+            if not self.running:
+                if self._owner is not None:
+                    logger.warning(f"MCP server '{self.name}' exited; restarting")
+                    await self._stop_owner()
+                    self._stats["restarts"] += 1
+                await self._start()
+            return self._session
+
+    async def _start(self) -> None:
+        ready = asyncio.get_running_loop().create_future()
+        self._stop = asyncio.Event()
+        self._owner = asyncio.create_task(self._own_connection(ready, self._stop), name=f"mcp-{self.name}")
+        try:
+            self._session = await asyncio.wait_for(asyncio.shield(ready), timeout=MCP_START_TIMEOUT)
+        except BaseException:
+            await self._stop_owner()
+            raise
+        self._stats["starts"] += 1
+        logger.info(f"MCP server '{self.name}' started")
+
+    async def _stop_owner(self) -> None:
+        owner, self._owner, self._session = self._owner, None, None
+        if owner is None:
+            return
+        self._stop.set()
+        done, _ = await asyncio.wait({owner}, timeout=PING_TIMEOUT)
+        if not done:
+            owner.cancel()
+
+    async def _own_connection(self, ready: asyncio.Future, stop: asyncio.Event) -> None:
+        try:
+            async with AsyncExitStack() as stack:
+                params = self.connection_params
+                if isinstance(params, StdioServerParameters):
+                    transports = await stack.enter_async_context(stdio_client(params, errlog=sys.stderr))
+                else:
+                    transports = await stack.enter_async_context(
+                        sse_client(
+                            url=params.url,
+                            headers=params.headers,
+                            timeout=params.timeout,
+                            sse_read_timeout=params.sse_read_timeout,
+                        )
+                    )
+                session = await stack.enter_async_context(ClientSession(*transports[:2]))
+                await session.initialize()
+                ready.set_result(session)
+                await stop.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e if isinstance(e, Exception) else ConnectionError(repr(e)))
+            elif not isinstance(e, asyncio.CancelledError):
+                logger.warning(f"MCP server '{self.name}' connection ended: {e!r}")
+            if not isinstance(e, Exception):
+                raise
+
+
+class PooledMCPTool(MCPTool):
+    """An MCP tool whose calls go through the shared pool instead of its own session."""
+
+    def __init__(self, mcp_tool: McpBaseTool, server: PooledMCPServer):
+        # MCPTool insists on a session manager; it is never opened, the pool owns the connection
+        super().__init__(mcp_tool=mcp_tool, mcp_session_manager=MCPSessionManager(server.connection_params))
+        self._server = server
+
+    async def run_async(self, *, args, tool_context: ToolContext):
+        return await self._server.call_tool(self.name, args)
+
+
+class PooledMCPToolset(BaseToolset):
+    """Drop-in replacement for ``MCPToolset`` backed by a pooled server.
+
+    Building an agent with it starts nothing; the server is launched the first
+    time the agent needs its tool list. Closing the toolset leaves the server
+    running for other agents, and the pool shuts it down.
+    """
+
+    def __init__(self, server: PooledMCPServer, tool_filter: Optional[Union[ToolPredicate, List[str]]] = None):
+        super().__init__(tool_filter=tool_filter)
+        self.server = server
+
+    async def get_tools(self, readonly_context: Optional[ReadonlyContext] = None) -> List[BaseTool]:
+        tools = [PooledMCPTool(tool, self.server) for tool in await self.server.list_tools()]
+        return [tool for tool in tools if self._is_tool_selected(tool, readonly_context)]
+
+    async def close(self) -> None:
+        pass
+
+
+class MCPServerPool:
+    """Registry of named MCP servers shared by every agent in the process."""
+
+    def __init__(self):
+        self._servers: Dict[str, PooledMCPServer] = {}
+        self._health_task: Optional[asyncio.Task] = None
+
+    def register(self, name: str, connection_params: ConnectionParams, **kwargs) -> PooledMCPServer:
+        """Register a server under ``name``; registering an existing name returns the existing server."""
+        if name not in self._servers:
+            self._servers[name] = PooledMCPServer(name, connection_params, **kwargs)
+        return self._servers[name]
+
+    def toolset(self, name: str, tool_filter: Optional[Union[ToolPredicate, List[str]]] = None) -> PooledMCPToolset:
+        """Return a toolset for a registered server."""
+        return PooledMCPToolset(self._servers[name], tool_filter=tool_filter)
+
+    def start_health_checks(self, interval: float = MCP_HEALTH_INTERVAL) -> None:
+        """Ping running servers every ``interval`` seconds from a background task."""
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.create_task(self._health_loop(interval), name="mcp-health")
+
+    async def close(self) -> None:
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        await asyncio.gather(*(server.close() for server in self._servers.values()), return_exceptions=True)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: server.stats() for name, server in self._servers.items()}
+
+    async def _health_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.gather(*(server.health_check() for server in self._servers.values()))
+
+
+_pool = MCPServerPool()
+
+
+def get_mcp_pool() -> MCPServerPool:
+    """Return the process-wide MCP server pool."""
+    return _pool
@@ -0,0 +1,188 @@
+"""
+OpenTelemetry setup for the standalone agent servers.
+Exports spans to the console or a JSON-lines file and renders metrics in Prometheus text format.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import threading
+from typing import Optional, Sequence
+
+from opentelemetry import metrics, trace
+from opentelemetry.sdk.metrics import Histogram as HistogramInstrument
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import Histogram, InMemoryMetricReader, Sum
+from opentelemetry.sdk.metrics.view import ExplicitBucketHistogramAggregation, View
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    ConsoleSpanExporter,
+    SpanExporter,
+    SpanExportResult,
+)
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from sub-millisecond cache hits to minute-long TTS turns
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+# How often the event-loop monitor wakes up to measure scheduling delay
+LOOP_LAG_INTERVAL = 0.5
+
+_metric_reader: Optional[InMemoryMetricReader] = None
+_setup_lock = threading.Lock()
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """Append finished spans to a file, one OTLP-style JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        lines = "".join(span.to_json(indent=None) + "\n" for span in spans)
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+        except OSError as e:
+            logger.warning(f"Could not write spans to {self.path}: {e}")
+            return SpanExportResult.FAILURE
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+
+class SpanDurationProcessor(SpanProcessor):
+    """Record every finished span's duration in a histogram keyed by span name.
+
+    ADK already opens spans for each LLM call (``call_llm``) and tool call
+    (``execute_tool <name>``), so this turns them into latency histograms
+    without touching the framework.
+    """
+
+    def __init__(self):
+        self._histogram = metrics.get_meter(__name__).create_histogram(
+            "span.duration", unit="s", description="Duration of traced operations by span name"
+        )
+
+    def on_end(self, span: ReadableSpan) -> None:
+        if span.start_time is None or span.end_time is None:
+            return
+        self._histogram.record((span.end_time - span.start_time) / 1e9, {"span": span.name})
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        # Nothing is buffered; returning True lets the provider go on to flush the exporters
+        return True
+
+
+def setup_telemetry(service_name: str, exporter: Optional[str] = None, traces_file: Optional[str] = None) -> None:
+    """
+    Install the global tracer and meter providers. Safe to call more than once.
+
+    Args:
+        service_name: Reported as the ``service.name`` resource attribute.
+        exporter: 'console', 'file' or 'none' (defaults to OTEL_TRACES_EXPORTER, then 'none').
+        traces_file: Destination for the 'file' exporter (defaults to OTEL_TRACES_FILE).
+    """
+    global _metric_reader
+    with _setup_lock:
+        if _metric_reader is not None:
+            return
+
+        resource = Resource.create({"service.name": service_name})
+        _metric_reader = InMemoryMetricReader()
+        metrics.set_meter_provider(
+            MeterProvider(
+                resource=resource,
+                metric_readers=[_metric_reader],
+                views=[
+                    View(
+                        instrument_type=HistogramInstrument,
+                        aggregation=ExplicitBucketHistogramAggregation(boundaries=LATENCY_BUCKETS),
+                    )
+                ],
+            )
+        )
+
+        tracer_provider = TracerProvider(resource=resource)
+        tracer_provider.add_span_processor(SpanDurationProcessor())
+        exporter = (exporter or os.getenv("OTEL_TRACES_EXPORTER", "none")).lower()
+        if exporter == "console":
+            tracer_provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+        elif exporter == "file":
+            path = traces_file or os.getenv("OTEL_TRACES_FILE", f"{service_name}_traces.jsonl")
+            tracer_provider.add_span_processor(BatchSpanProcessor(JsonLinesSpanExporter(path)))
+            logger.info(f"Writing traces to {path}")
+        trace.set_tracer_provider(tracer_provider)
+        logger.info(f"Telemetry initialized for '{service_name}' (trace exporter: {exporter})")
+
+
+async def monitor_event_loop_lag(interval: float = LOOP_LAG_INTERVAL) -> None:
+    """Record how late the event loop wakes up; run as a background task for the server's lifetime."""
+    histogram = metrics.get_meter(__name__).create_histogram(
+        "event_loop.lag", unit="s", description="Delay between a scheduled wake-up and when the loop ran it"
+    )
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        histogram.record(max(0.0, loop.time() - expected))
+
+
+def _metric_name(name: str) -> str:
+    return re.sub(r"[^a-zA-Z0-9_:]", "_", name)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(attributes, extra: Optional[dict] = None) -> str:
+    items = {**dict(attributes or {}), **(extra or {})}
+    if not items:
+        return ""
+    return "{" + ",".join(f'{_metric_name(str(k))}="{_escape(v)}"' for k, v in items.items()) + "}"
+
+
+def render_prometheus() -> str:
+    """Render the current metrics in the Prometheus text exposition format."""
+    if _metric_reader is None:
+        return ""
+    data = _metric_reader.get_metrics_data()
+    if data is None:
+        return ""
+
+    lines = []
+    for resource_metrics in data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                name = _metric_name(metric.name)
+                if metric.unit == "s" and not name.endswith("_seconds"):
+                    name += "_seconds"
+                if isinstance(metric.data, Histogram):
+                    lines.append(f"# TYPE {name} histogram")
+                    for point in metric.data.data_points:
+                        cumulative = 0
+                        for bound, count in zip(point.explicit_bounds, point.bucket_counts):
+                            cumulative += count
+                            lines.append(f"{name}_bucket{_labels(point.attributes, {'le': f'{bound:g}'})} {cumulative}")
+                        lines.append(f"{name}_bucket{_labels(point.attributes, {'le': '+Inf'})} {point.count}")
+                        lines.append(f"{name}_sum{_labels(point.attributes)} {point.sum}")
+                        lines.append(f"{name}_count{_labels(point.attributes)} {point.count}")
+                else:
+                    kind = "counter" if isinstance(metric.data, Sum) and metric.data.is_monotonic else "gauge"
+                    sample = name
+                    if kind == "counter":
+                        # Counter samples carry a _total suffix; the TYPE line names the family
+                        name = name.removesuffix("_total")
+                        sample = f"{name}_total"
+                    lines.append(f"# TYPE {name} {kind}")
+                    for point in metric.data.data_points:
+                        lines.append(f"{sample}{_labels(point.attributes)} {point.value}")
+    return "\n".join(lines) + "\n"
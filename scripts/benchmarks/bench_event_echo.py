@@ -0,0 +1,130 @@
+"""
+Benchmark for the speaker TaskManager's event echo.
+
+Runs real agent turns through ``TaskManager._run_task`` (ADK Runner, session
+service and event handling included) with the scripted LLM from ``fakes.py``
+and an in-process ``text_to_speech`` tool returning a large payload. Each
+turn makes ``--tool-calls`` tool calls. The per-turn CPU time, peak
+allocations and response size are compared across three modes:
+
+- before: the pre-ring-buffer strategy, which ``model_dump``s every event as
+  it arrives and keeps the last SPEAKER_EVENT_ECHO_SIZE of them
+- after: ``echo_events`` on, the trailing events serialized once at the end
+- off: ``echo_events`` off
+
+Usage (from the project root):
+    python scripts/benchmarks/bench_event_echo.py --tool-calls 50 --turns 50
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Dict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(BENCH_DIR, "..", ".."))
+
+# The agents import each other both as `agents.<name>` and, like `adk web`, as top-level packages
+for path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, "agents"), BENCH_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+
+def build_task_managers(tool_calls: int, payload_chars: int):
+    """Return ``(TaskManager, DumpEveryEventTaskManager)`` around the same scripted agent."""
+    os.environ.setdefault("AUDIO_OUTPUT_DIR", tempfile.mkdtemp(prefix="bench_echo_"))
+    from google.adk.agents import Agent
+
+    from agents.speaker.task_manager import DEFAULT_EVENT_ECHO_SIZE, TaskManager
+    from fakes import ScriptedLlm
+
+    class DumpEveryEventTaskManager(TaskManager):
+        """The echo as it was before the ring buffer: every event is serialized as it arrives."""
+
+        async def _run_task(self, message, context, session_id):
+            self._dumped = []
+            result = await super()._run_task(message, {**context, "echo_events": False}, session_id)
+            result["data"]["raw_events"] = self._dumped[-DEFAULT_EVENT_ECHO_SIZE:]
+            return result
+
+        async def _track_synthesis(self, event, user_id, session_id, audio):
+            # Called once per event from the _run_task loop
+            self._dumped.append(event.model_dump(exclude_none=True))
+            return await super()._track_synthesis(event, user_id, session_id, audio)
+
+    output_path = os.path.join(os.environ["AUDIO_OUTPUT_DIR"], "bench.mp3")
+
+    def text_to_speech(text: str, voice_name: str) -> dict:
+        """Convert text to speech and save it as an MP3 file."""
+        return {
+            "result": {
+                "content": [
+                    {"type": "text", "text": f"Success. File saved as: {output_path}. Voice used: {voice_name}"},
+                    {"type": "text", "text": "y" * payload_chars},
+                ]
+            }
+        }
+
+    agent = Agent(
+        name="tts_speaker_agent",
+        description="Speaker agent backed by local fakes.",
+        model=ScriptedLlm(model="scripted-gemini", tool_calls=tool_calls),
+        instruction="Convert the user's text to speech.",
+        tools=[text_to_speech],
+    )
+    return TaskManager(agent), DumpEveryEventTaskManager(agent)
+
+
+async def measure(task_manager, context: Dict[str, Any], turns: int) -> Dict[str, float]:
+    """Return CPU ms per turn, peak KiB allocated during one turn and the response size."""
+    message = "Benchmark headline. " * 10
+
+    async def turn() -> Dict[str, Any]:
+        result = await task_manager._run_task(message, context, None)
+        assert result["status"] == "success", result
+        return result
+
+    await turn()  # warm up pydantic serializers
+
+    start = time.process_time()
+    for _ in range(turns):
+        await turn()
+    cpu_ms = (time.process_time() - start) * 1000 / turns
+
+    tracemalloc.start()
+    result = await turn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    size = len(json.dumps(result, default=str))
+    return {"cpu_ms": cpu_ms, "peak_kib": peak / 1024, "response_kib": size / 1024}
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Benchmark the speaker's event echo before and after the ring buffer")
+    parser.add_argument("--tool-calls", type=int, default=50, help="Tool calls per turn (each adds two events)")
+    parser.add_argument("--turns", type=int, default=50, help="Turns to time per mode")
+    parser.add_argument("--payload-chars", type=int, default=4000, help="Size of each tool response payload")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    task_manager, before_task_manager = build_task_managers(args.tool_calls, args.payload_chars)
+    print(f"{args.tool_calls} tool calls/turn, {args.turns} turns, {args.payload_chars}-char tool responses\n")
+    print(f"{'mode':<28}{'cpu ms/turn':>14}{'peak KiB/turn':>16}{'response KiB':>15}")
+    modes = [
+        ("before (dump every event)", before_task_manager, {}),
+        ("after (echo_events=True)", task_manager, {"echo_events": True}),
+        ("off (echo_events=False)", task_manager, {"echo_events": False}),
+    ]
+    for label, manager, context in modes:
+        result = await measure(manager, context, args.turns)
+        print(f"{label:<28}{result['cpu_ms']:>14.3f}{result['peak_kib']:>16.1f}{result['response_kib']:>15.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
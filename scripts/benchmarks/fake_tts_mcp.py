@@ -0,0 +1,40 @@
+"""
+MCP server standing in for ElevenLabs in load tests.
+
+Exposes a ``text_to_speech`` tool with the same arguments and response text
+as the ElevenLabs MCP server. Latency is FAKE_TTS_LATENCY seconds plus
+FAKE_TTS_LATENCY_PER_CHAR per input character; files are written to
+FAKE_TTS_OUTPUT_DIR. Serves over stdio, or over SSE when FAKE_TTS_TRANSPORT=sse
+(address set with FASTMCP_HOST / FASTMCP_PORT).
+"""
+
+import asyncio
+import os
+import uuid
+
+from mcp.server.fastmcp import FastMCP
+
+LATENCY = float(os.getenv("FAKE_TTS_LATENCY", "0.5"))
+LATENCY_PER_CHAR = float(os.getenv("FAKE_TTS_LATENCY_PER_CHAR", "0"))
+OUTPUT_DIR = os.getenv("FAKE_TTS_OUTPUT_DIR", "/tmp/fake_tts")
+TRANSPORT = os.getenv("FAKE_TTS_TRANSPORT", "stdio")
+
+# A valid MPEG-1 Layer III frame header followed by silence, repeated per ~100 chars
+FRAME = b"\xff\xfb\x90\x64" + b"\x00" * 413
+
+mcp = FastMCP("fake-elevenlabs")
+
+
+@mcp.tool()
+async def text_to_speech(text: str, voice_name: str = "Will") -> str:
+    """Convert text to speech and save it as an MP3 file."""
+    await asyncio.sleep(LATENCY + LATENCY_PER_CHAR * len(text))
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    path = os.path.join(OUTPUT_DIR, f"tts_{uuid.uuid4().hex}.mp3")
+    with open(path, "wb") as f:
+        f.write(FRAME * max(1, len(text) // 100))
+    return f"Success. File saved as: {path}. Voice used: {voice_name}"
+
+
+if __name__ == "__main__":
+    mcp.run(transport=TRANSPORT)
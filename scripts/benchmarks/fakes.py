@@ -0,0 +1,183 @@
+"""
+Local stand-ins for the external services the agents depend on.
+
+- ``ScriptedLlm``: a Gemini replacement that answers a TTS request with one
+  (or ``tool_calls``) ``text_to_speech`` tool calls, then a final message
+  quoting the saved path.
+- ``create_fake_reddit_app``: a Starlette app speaking just enough of the
+  Reddit OAuth API (token, hot and new listings, subreddit search) for both the
+  PRAW scout and the async scout, serving ``get_mock_reddit_contractor_news``
+  data. ``POST /_submit`` adds a post so the subreddit watcher sees new ones.
+- ``fake_tts_mcp.py`` (next to this file): a stdio MCP server exposing a
+  ``text_to_speech`` tool shaped like the ElevenLabs one.
+
+Each fake takes a configurable latency so load tests can model slow upstreams.
+"""
+
+import asyncio
+import itertools
+import re
+import time
+from typing import AsyncGenerator
+
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from reddit_contractor_scount.agent import get_mock_reddit_contractor_news
+
+AUDIO_PATH_PATTERN = re.compile(r"(/\S+?\.mp3)")
+
+
+class ScriptedLlm(BaseLlm):
+    """Deterministic LLM for the speaker: call the TTS tool ``tool_calls`` times, then report the file."""
+
+    latency: float = 0.0
+    tool_name: str = "text_to_speech"
+    voice_name: str = "Will"
+    tool_calls: int = 1
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        await asyncio.sleep(self.latency)
+        # Walk back to the user's message, counting the tool calls answered since
+        calls_made = 0
+        text = ""
+        for content in reversed(llm_request.contents):
+            if any(part.function_response for part in content.parts or []):
+                calls_made += 1
+            elif content.role == "user":
+                text = "".join(part.text or "" for part in content.parts or [])
+                break
+        last = llm_request.contents[-1]
+        tool_response = next((part.function_response for part in last.parts or [] if part.function_response), None)
+
+        if tool_response is None or calls_made < self.tool_calls:
+            call = types.FunctionCall(name=self.tool_name, args={"text": text, "voice_name": self.voice_name})
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(function_call=call)]))
+            return
+
+        match = AUDIO_PATH_PATTERN.search(str(tool_response.response))
+        message = (
+            f"I've converted your text to speech. The audio file is saved at `{match.group(1)}`"
+            if match
+            else "Sorry, the speech could not be generated."
+        )
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=message)]))
+
+
+def _listing(subreddit: str, limit: int) -> dict:
+    titles = get_mock_reddit_contractor_news(subreddit).get(subreddit.lower(), [])
+    children = [
+        {
+            "kind": "t3",
+            "data": {
+                "id": f"{subreddit.lower()}{i}",
+                "name": f"t3_{subreddit.lower()}{i}",
+                "title": title,
+                "subreddit": subreddit,
+                "permalink": f"/r/{subreddit}/comments/{subreddit.lower()}{i}/",
+                "stickied": False,
+            },
+        }
+        for i, title in enumerate(titles[:limit])
+    ]
+    return {"kind": "Listing", "data": {"children": children, "after": None}}
+
+
+def _post(subreddit: str, post_id: str, title: str, created_utc: float) -> dict:
+    return {
+        "kind": "t3",
+        "data": {
+            "id": post_id,
+            "name": f"t3_{post_id}",
+            "title": title,
+            "subreddit": subreddit,
+            "created_utc": created_utc,
+            "permalink": f"/r/{subreddit}/comments/{post_id}/",
+            "stickied": False,
+        },
+    }
+
+
+def create_fake_reddit_app(latency: float = 0.0) -> Starlette:
+    """
+    Build the fake Reddit API.
+
+    Point both scouts at it with the REDDIT_API_BASE_URL and
+    REDDIT_AUTH_BASE_URL environment variables.
+    """
+    stats = {"requests": 0}
+    ids = itertools.count(1)
+    # Newest last; seeded with the mock titles, one minute apart
+    submissions: list[dict] = []
+    seeded_at = time.time() - 3600
+    for subreddit in ("hvac", "contractors", "plumbing", "electricians", "homeimprovement", "construction", "smallbusiness"):
+        for title in get_mock_reddit_contractor_news(subreddit).get(subreddit, []):
+            submissions.append(_post(subreddit, f"p{next(ids)}", title, seeded_at + len(submissions) * 60))
+
+    async def token(request: Request):
+        stats["requests"] += 1
+        return JSONResponse({"access_token": "fake-token", "token_type": "bearer", "expires_in": 3600, "scope": "*"})
+
+    async def hot(request: Request):
+        stats["requests"] += 1
+        await asyncio.sleep(latency)
+        subreddit = request.path_params["subreddit"]
+        if isinstance(get_mock_reddit_contractor_news(subreddit).get(subreddit.lower()), str):
+            return JSONResponse({"message": "Not Found", "error": 404}, status_code=404)
+        limit = int(request.query_params.get("limit", 25))
+        return JSONResponse(
+            _listing(subreddit, limit),
+            headers={"x-ratelimit-remaining": "600", "x-ratelimit-used": "0", "x-ratelimit-reset": "600"},
+        )
+
+    async def new(request: Request):
+        stats["requests"] += 1
+        await asyncio.sleep(latency)
+        names = {name.lower() for name in request.path_params["subreddit"].split("+")}
+        if any(isinstance(get_mock_reddit_contractor_news(name).get(name), str) for name in names):
+            return JSONResponse({"message": "Not Found", "error": 404}, status_code=404)
+        matching = [post for post in submissions if post["data"]["subreddit"] in names]
+        before = request.query_params.get("before")
+        if before:
+            # Like Reddit: posts newer than ``before``, nothing if it is unknown
+            position = next((i for i, post in enumerate(matching) if post["data"]["name"] == before), None)
+            matching = [] if position is None else matching[position + 1:][: int(request.query_params.get("limit", 25))]
+        else:
+            matching = matching[-int(request.query_params.get("limit", 25)):]
+        return JSONResponse({"kind": "Listing", "data": {"children": list(reversed(matching)), "after": None}})
+
+    async def submit(request: Request):
+        body = await request.json()
+        post = _post(body["subreddit"].lower(), f"p{next(ids)}", body["title"], time.time())
+        submissions.append(post)
+        return JSONResponse(post["data"])
+
+    async def search_names(request: Request):
+        stats["requests"] += 1
+        await asyncio.sleep(latency)
+        form = await request.form()
+        query = form.get("query") or request.query_params.get("query", "")
+        return JSONResponse({"names": [query]})
+
+    async def get_stats(request: Request):
+        return JSONResponse(stats)
+
+    return Starlette(
+        routes=[
+            Route("/api/v1/access_token", token, methods=["POST"]),
+            Route("/api/search_reddit_names/", search_names, methods=["GET", "POST"]),
+            Route("/api/search_reddit_names", search_names, methods=["GET", "POST"]),
+            Route("/r/{subreddit}/hot", hot),
+            Route("/r/{subreddit}/hot/", hot),
+            Route("/r/{subreddit}/new", new),
+            Route("/r/{subreddit}/new/", new),
+            Route("/_submit", submit, methods=["POST"]),
+            Route("/_stats", get_stats),
+        ]
+    )
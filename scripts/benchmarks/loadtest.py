@@ -0,0 +1,457 @@
+"""
+Load-test harness for the speaker A2A server and the Reddit tools, run against local fakes.
+
+``speaker`` builds the real TaskManager, Runner and A2A app around a scripted
+LLM and a fake TTS MCP server (through the shared MCP pool), serves it with
+uvicorn, and drives ``POST /run`` at the target concurrency. ``reddit`` runs
+the async scout tool or the PRAW batch tool against a fake Reddit API.
+``startup`` measures the speaker's cold start in fresh processes: the time to
+import its entry point, to bind (first answer on /health) and to be ready
+(/ready returns 200), with the fake TTS server reached over SSE.
+
+Each run reports throughput, p50/p95/p99 latency and memory, appends the
+result (with the current git commit) to scripts/benchmarks/results/, and
+compares it with the previous run that used the same parameters.
+
+Usage (from the project root):
+    python scripts/benchmarks/loadtest.py speaker --requests 200 --concurrency 16 --unique 50
+    python scripts/benchmarks/loadtest.py reddit --tool async --requests 500 --concurrency 32
+    python scripts/benchmarks/loadtest.py speaker --max-regression 0.2   # exit 1 on a >20% regression
+    python scripts/benchmarks/loadtest.py startup --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(BENCH_DIR, "..", ".."))
+RESULTS_DIR = os.path.join(BENCH_DIR, "results")
+
+# The agents import each other both as `agents.<name>` and, like `adk web`, as top-level packages
+for path in (PROJECT_ROOT, os.path.join(PROJECT_ROOT, "agents"), BENCH_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import httpx
+import uvicorn
+
+SUBREDDITS = ["hvac", "contractors", "plumbing", "electricians", "homeimprovement", "construction"]
+
+# Metrics compared between runs: (label, path into the metrics dict, higher is better)
+LOAD_CHECKS = [
+    ("throughput_rps", ("throughput_rps",), True),
+    ("p50 ms", ("latency_ms", "p50"), False),
+    ("p95 ms", ("latency_ms", "p95"), False),
+    ("p99 ms", ("latency_ms", "p99"), False),
+    ("max rss MB", ("rss_mb", "max"), False),
+]
+STARTUP_CHECKS = [
+    ("import p50 ms", ("import_ms", "p50"), False),
+    ("bind p50 ms", ("bind_ms", "p50"), False),
+    ("ready p50 ms", ("ready_ms", "p50"), False),
+]
+CHECKS = {"speaker": LOAD_CHECKS, "reddit": LOAD_CHECKS, "startup": STARTUP_CHECKS}
+
+
+def _percentile(samples: List[float], q: float) -> Optional[float]:
+    """Nearest-rank percentile of ``samples`` (0 < q <= 100), in milliseconds."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(q / 100 * len(ordered))) - 1))
+    return round(ordered[index] * 1000, 1)
+
+
+def _rss_mb() -> float:
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        return 0.0
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _serve(app, port: int) -> tuple[uvicorn.Server, asyncio.Task]:
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", access_log=False))
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.05)
+    return server, task
+
+
+async def _drive(
+    call: Callable[[int], Awaitable[bool]], requests: int, concurrency: int
+) -> Dict[str, Any]:
+    """Issue ``requests`` calls with ``concurrency`` workers; ``call(i)`` returns whether it succeeded."""
+    latencies: List[float] = []
+    failures = 0
+    next_index = 0
+    rss_samples = [_rss_mb()]
+
+    async def worker():
+        nonlocal next_index, failures
+        while next_index < requests:
+            index = next_index
+            next_index += 1
+            started = time.perf_counter()
+            try:
+                ok = await call(index)
+            except Exception as e:
+                logging.getLogger(__name__).debug(f"Request {index} failed: {e!r}")
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                failures += 1
+
+    async def sample_memory():
+        while True:
+            await asyncio.sleep(0.1)
+            rss_samples.append(_rss_mb())
+
+    sampler = asyncio.create_task(sample_memory())
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    sampler.cancel()
+
+    return {
+        "requests": requests,
+        "ok": len(latencies),
+        "failed": failures,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else None,
+        "latency_ms": {
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "max": _percentile(latencies, 100),
+        },
+        "rss_mb": {"start": round(rss_samples[0], 1), "max": round(max(rss_samples), 1), "end": round(_rss_mb(), 1)},
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+async def bench_speaker(args) -> Dict[str, Any]:
+    os.environ.setdefault("AUDIO_OUTPUT_DIR", tempfile.mkdtemp(prefix="bench_speaker_"))
+    from google.adk.agents import Agent
+    from mcp import StdioServerParameters
+
+    from agents.speaker.task_manager import TaskManager
+    from common.a2a_server import create_agent_server
+    from common.mcp_pool import get_mcp_pool
+    from fakes import ScriptedLlm
+
+    logging.getLogger().setLevel(logging.WARNING)
+    pool = get_mcp_pool()
+    pool.register(
+        "fake_tts",
+        StdioServerParameters(
+            command=sys.executable,
+            args=[os.path.join(BENCH_DIR, "fake_tts_mcp.py")],
+            env={
+                **os.environ,
+                "FAKE_TTS_LATENCY": str(args.tts_latency),
+                "FAKE_TTS_OUTPUT_DIR": os.path.join(os.environ["AUDIO_OUTPUT_DIR"], "fake_tts"),
+                "FASTMCP_LOG_LEVEL": "WARNING",
+            },
+        ),
+        max_concurrent_calls=args.tts_concurrency,
+    )
+    agent = Agent(
+        name="tts_speaker_agent",
+        description="Speaker agent backed by local fakes.",
+        model=ScriptedLlm(model="scripted-gemini", latency=args.llm_latency),
+        instruction="Convert the user's text to speech.",
+        tools=[pool.toolset("fake_tts")],
+    )
+    task_manager = TaskManager(agent, max_in_flight=args.max_in_flight, max_queue=args.max_queue)
+    app = create_agent_server(agent.name, agent.description, task_manager)
+    port = _free_port()
+    server, serve_task = await _serve(app, port)
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", limits=limits, timeout=args.timeout) as client:
+        # Start the MCP server outside the measured window, as a warm process would have
+        await client.post("/run", json={"message": "Warm-up request.", "context": {"cache": False}})
+
+        async def call(index: int) -> bool:
+            message = f"Benchmark headline number {index % args.unique}. " * args.sentences
+            context = {"echo_events": False, "chunked": args.chunked, "user_id": f"bench-{index % 32}"}
+            response = await client.post("/run", json={"message": message, "context": context})
+            return response.status_code == 200 and response.json().get("status") == "success"
+
+        metrics = await _drive(call, args.requests, args.concurrency)
+        stats = (await client.get("/stats")).json()
+
+    metrics["server"] = {
+        key: stats.get(key)
+        for key in ("completed", "failed", "rejected", "expired_in_queue", "timed_out", "tts_syntheses")
+    }
+    metrics["server"]["audio_cache_hits"] = (stats.get("audio_cache") or {}).get("hits")
+    metrics["server"]["queue_wait_p95_ms"] = stats["queue_wait_ms"]["p95"]
+    server.should_exit = True
+    await serve_task
+    await pool.close()
+    return metrics
+
+
+async def bench_reddit(args) -> Dict[str, Any]:
+    port = _free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    os.environ.update(
+        {
+            "REDDIT_CLIENT_ID": "bench",
+            "REDDIT_CLIENT_SECRET": "bench",
+            "REDDIT_USER_AGENT": "adk-made-simple-bench",
+            "REDDIT_BACKEND": "api",
+            "REDDIT_API_BASE_URL": base_url,
+            "REDDIT_AUTH_BASE_URL": base_url,
+            "praw_check_for_updates": "False",
+        }
+    )
+    # Imported after the environment is set: the scouts read their URLs at import time
+    from fakes import create_fake_reddit_app
+
+    server, serve_task = await _serve(create_fake_reddit_app(latency=args.reddit_latency), port)
+
+    from async_reddit_scout.agent import fetch_reddit_hot_threads
+    from reddit_contractor_scount.agent import get_reddit_cache_stats, get_reddit_contractor_news_batch
+
+    def succeeded(result: dict) -> bool:
+        return bool(result) and all(isinstance(titles, list) and not str(titles[0]).startswith("Error") for titles in result.values())
+
+    if args.tool == "async":
+        async def call(index: int) -> bool:
+            return succeeded(await fetch_reddit_hot_threads(SUBREDDITS[index % len(SUBREDDITS)], limit=5))
+    else:
+        async def call(index: int) -> bool:
+            batch = [SUBREDDITS[(index + i) % len(SUBREDDITS)] for i in range(args.batch_size)]
+            return succeeded(await asyncio.to_thread(get_reddit_contractor_news_batch, batch))
+
+    metrics = await _drive(call, args.requests, args.concurrency)
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        metrics["upstream_requests"] = (await client.get("/_stats")).json()["requests"]
+    if args.tool == "batch":
+        metrics["cache"] = get_reddit_cache_stats()
+    server.should_exit = True
+    await serve_task
+    return metrics
+
+
+def _wait_for_port(port: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+async def _cold_start(env: Dict[str, str], timeout: float) -> Dict[str, Any]:
+    """Start ``python -m speaker`` and time how long it takes to bind and to become ready."""
+    port = _free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "speaker"],
+        cwd=os.path.join(PROJECT_ROOT, "agents"),
+        env={**env, "SPEAKER_A2A_HOST": "127.0.0.1", "SPEAKER_A2A_PORT": str(port)},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    bind_s = None
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=5) as client:
+            while time.perf_counter() - started < timeout:
+                if process.poll() is not None:
+                    raise RuntimeError(f"speaker exited with code {process.returncode}")
+                try:
+                    response = await client.get("/ready")
+                except httpx.TransportError:
+                    await asyncio.sleep(0.02)
+                    continue
+                bind_s = bind_s or time.perf_counter() - started
+                readiness = response.json()
+                if readiness.get("state") == "ready":
+                    return {"bind_s": bind_s, "ready_s": time.perf_counter() - started, "steps": readiness.get("steps", {})}
+                if readiness.get("state") == "failed":
+                    raise RuntimeError(f"speaker warmup failed: {readiness.get('error')}")
+                await asyncio.sleep(0.02)
+        raise TimeoutError(f"speaker not ready after {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def bench_startup(args) -> Dict[str, Any]:
+    tts_port = _free_port()
+    output_dir = tempfile.mkdtemp(prefix="bench_startup_")
+    env = {**os.environ, "AUDIO_OUTPUT_DIR": output_dir, "SPEAKER_PREWARM_SESSIONS": str(args.prewarm_sessions)}
+    tts_env = {
+        **env,
+        "FAKE_TTS_TRANSPORT": "sse",
+        "FASTMCP_HOST": "127.0.0.1",
+        "FASTMCP_PORT": str(tts_port),
+        "FASTMCP_LOG_LEVEL": "WARNING",
+        "FAKE_TTS_OUTPUT_DIR": os.path.join(output_dir, "fake_tts"),
+    }
+    tts = subprocess.Popen(
+        [sys.executable, os.path.join(BENCH_DIR, "fake_tts_mcp.py")],
+        env=tts_env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    env["ELEVENLABS_MCP_URL"] = f"http://127.0.0.1:{tts_port}/sse"
+    try:
+        await asyncio.to_thread(_wait_for_port, tts_port, 30)
+
+        import_times: List[float] = []
+        probe = "import time; t = time.perf_counter(); import speaker.__main__; print(time.perf_counter() - t)"
+        for _ in range(args.runs):
+            result = subprocess.run(
+                [sys.executable, "-c", probe], cwd=os.path.join(PROJECT_ROOT, "agents"), env=env,
+                capture_output=True, text=True, check=True,
+            )
+            import_times.append(float(result.stdout.strip().splitlines()[-1]))
+
+        starts = [await _cold_start(env, args.timeout) for _ in range(args.runs)]
+    finally:
+        tts.terminate()
+        tts.wait()
+
+    steps = sorted({step for start in starts for step in start["steps"]})
+    return {
+        "runs": args.runs,
+        "import_ms": {"p50": _percentile(import_times, 50), "max": _percentile(import_times, 100)},
+        "bind_ms": {"p50": _percentile([s["bind_s"] for s in starts], 50), "max": _percentile([s["bind_s"] for s in starts], 100)},
+        "ready_ms": {"p50": _percentile([s["ready_s"] for s in starts], 50), "max": _percentile([s["ready_s"] for s in starts], 100)},
+        "warmup_steps_p50_ms": {step: _percentile([s["steps"][step] for s in starts if step in s["steps"]], 50) for step in steps},
+    }
+
+
+def _lookup(metrics: Dict[str, Any], path: tuple) -> Any:
+    for key in path:
+        if not isinstance(metrics, dict):
+            return None
+        metrics = metrics.get(key)
+    return metrics
+
+
+def _git_commit() -> Dict[str, Any]:
+    def git(*argv):
+        return subprocess.run(["git", *argv], cwd=PROJECT_ROOT, capture_output=True, text=True).stdout.strip()
+
+    return {"commit": git("rev-parse", "--short", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))}
+
+
+def _store_and_compare(target: str, params: Dict[str, Any], metrics: Dict[str, Any], max_regression: Optional[float]) -> bool:
+    """Append this run to the results file and compare it with the last run using the same parameters."""
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    path = os.path.join(RESULTS_DIR, f"{target}.jsonl")
+    previous = None
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry.get("params") == params:
+                    previous = entry
+
+    entry = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        **_git_commit(),
+        "python": sys.version.split()[0],
+        "params": params,
+        "metrics": metrics,
+    }
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+    print(f"\nStored result in {os.path.relpath(path, PROJECT_ROOT)}")
+
+    if previous is None:
+        print("No earlier run with these parameters to compare against.")
+        return True
+
+    print(f"Compared with {previous.get('commit')} ({previous['timestamp']}):")
+    regressed = False
+    for label, path, higher_is_better in CHECKS[target]:
+        before, after = _lookup(previous["metrics"], path), _lookup(metrics, path)
+        if not before or after is None:
+            continue
+        change = (after - before) / before
+        worse = -change if higher_is_better else change
+        flag = ""
+        if max_regression is not None and worse > max_regression:
+            flag = "  <-- REGRESSION"
+            regressed = True
+        print(f"  {label:<15}{before:>10} -> {after:<10} ({change:+.1%}){flag}")
+    return not regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the agents against local fakes")
+    parser.add_argument("--requests", type=int, default=200, help="Total requests to send")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight at once")
+    parser.add_argument("--max-regression", type=float, default=None, help="Fail if a metric is this fraction worse than the last comparable run")
+    parser.add_argument("--no-store", action="store_true", help="Print results without recording them")
+    subparsers = parser.add_subparsers(dest="target", required=True)
+
+    speaker = subparsers.add_parser("speaker", help="Drive the speaker A2A /run endpoint")
+    speaker.add_argument("--unique", type=int, default=50, help="Distinct messages (lower means more cache hits)")
+    speaker.add_argument("--sentences", type=int, default=1, help="Sentences per message")
+    speaker.add_argument("--chunked", action="store_true", help="Use chunked TTS")
+    speaker.add_argument("--llm-latency", type=float, default=0.2, help="Seconds per fake LLM call")
+    speaker.add_argument("--tts-latency", type=float, default=0.5, help="Seconds per fake TTS call")
+    speaker.add_argument("--tts-concurrency", type=int, default=8, help="Concurrent calls allowed to the TTS server")
+    speaker.add_argument("--max-in-flight", type=int, default=8, help="TaskManager concurrent turns")
+    speaker.add_argument("--max-queue", type=int, default=256, help="TaskManager admission queue")
+    speaker.add_argument("--timeout", type=float, default=120, help="Client timeout in seconds")
+
+    reddit = subparsers.add_parser("reddit", help="Call the Reddit tools against a fake Reddit API")
+    reddit.add_argument("--tool", choices=["async", "batch"], default="async", help="Async scout tool or PRAW batch tool")
+    reddit.add_argument("--batch-size", type=int, default=3, help="Subreddits per batch call")
+    reddit.add_argument("--reddit-latency", type=float, default=0.1, help="Seconds per fake Reddit API call")
+
+    startup = subparsers.add_parser("startup", help="Time the speaker server's cold start")
+    startup.add_argument("--runs", type=int, default=5, help="Fresh processes to start")
+    startup.add_argument("--prewarm-sessions", type=int, default=0, help="Sessions created during warmup")
+    startup.add_argument("--timeout", type=float, default=120, help="Seconds allowed per start")
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    bench = {"speaker": bench_speaker, "reddit": bench_reddit, "startup": bench_startup}[args.target]
+    metrics = asyncio.run(bench(args))
+
+    params = {k: v for k, v in vars(args).items() if k not in ("max_regression", "no_store")}
+    print(json.dumps({"params": params, "metrics": metrics}, indent=2))
+    if not args.no_store and not _store_and_compare(args.target, params, metrics, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
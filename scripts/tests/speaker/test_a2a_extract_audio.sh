@@ -13,6 +13,7 @@
 #   "status": "success",
 #   "data": {
 #     "audio_url": "file:///tmp/audio_output/audio_abc.mp3",
+#     "audio_path": "/tmp/audio_output/audio_abc.mp3",
 #     "raw_events": [...], 
 #     "voice_id": "..."
 #   },
@@ -78,7 +79,7 @@ echo "-----------------------------------------"
 echo "A2A Test Script Notes:"
 echo "- This script targets the standalone agent endpoint (port 8003)."
 echo "- It relies on implicit session creation via the /run endpoint."
-echo "- Audio file path extraction assumes the agent returns the path in the response text."
+echo "- data.audio_url is captured from the text_to_speech tool response, not parsed from the reply text."
 
 # Note: This requires jq to be installed for parsing the JSON response
 # and grep for extracting file paths 
\ No newline at end of file
@@ -0,0 +1,40 @@
+#!/bin/bash
+
+# Test script for the streaming (Server-Sent Events) endpoint of the standalone A2A speaker agent.
+# Events are printed as they arrive, so time-to-first-event can be eyeballed against /run.
+
+# Expected Response Structure (from Standalone A2A /run/stream):
+# A text/event-stream where each event has a name and a JSON data payload:
+#   event: accepted          data: {"session_id": "..."}
+#   event: tool_call_start   data: {"id": "...", "name": "text_to_speech", "args": {...}}
+#   event: tool_call_end     data: {"id": "...", "name": "text_to_speech", "response": {...}}
+#   event: text              data: {"text": "partial model text"}
+#   event: message           data: {"text": "complete model text"}
+#   event: audio             data: {"audio_url": "file:///tmp/audio_output/audio_abc.mp3"}
+#   event: done              data: {"message": "...", "status": "success", "data": {...}, "session_id": "..."}
+#   event: error             data: {"message": "...", "error_type": "..."}
+
+USER_ID="test-user"
+SESSION_ID="test-a2a-stream-$(date +%s)"  # Unique session ID for the streaming test
+
+echo "Streaming from A2A endpoint (http://localhost:8003/run/stream)..."
+START=$(date +%s.%N)
+
+# -N disables buffering so each event is shown the moment it arrives
+curl -s -N -X POST "http://localhost:8003/run/stream" \
+  -H "Content-Type: application/json" \
+  -d "{
+    \"message\": \"Please say hello from the A2A streaming test\",
+    \"context\": {\"user_id\": \"$USER_ID\"},
+    \"session_id\": \"$SESSION_ID\"
+  }" | while IFS= read -r line; do
+    if [ -n "$line" ]; then
+      NOW=$(date +%s.%N)
+      printf "[+%6.2fs] %s\n" "$(echo "$NOW - $START" | bc)" "$line"
+    fi
+  done
+
+echo "-----------------------------------------"
+echo "A2A Streaming Test Notes:"
+echo "- The first 'accepted' event is sent as soon as the request gets a scheduler slot."
+echo "- A 429/503 JSON response instead of a stream means the speaker is at capacity."